@@ -1,5 +1,12 @@
+from pathlib import Path
+
 import streamlit as st
 
+
+@st.cache_data
+def read_css(file_name):
+    return Path(file_name).read_text()
+
+
 def local_css(file_name):
-    with open(file_name) as f:
-        st.markdown('<style>{}</style>'.format(f.read()), unsafe_allow_html=True)
\ No newline at end of file
+    st.markdown('<style>{}</style>'.format(read_css(file_name)), unsafe_allow_html=True)
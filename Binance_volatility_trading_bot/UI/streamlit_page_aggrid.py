@@ -6,14 +6,13 @@ import pandas as pd
 from web_layout.utils import *
 from web_layout.data import *
 from sqlalchemy import create_engine
-from dateutil.parser import parse
 from update_UI import update
 from pathlib import Path
 
 user_data_path = str(Path(__file__).parent.parent.parent.as_posix())
 
         
-@st.cache(allow_output_mutation=True)
+@st.cache_resource(ttl=3600)
 def get_db_connection():
     database = "transactions.db"
     try:
@@ -73,7 +72,7 @@ with kpi21:
         color = 'green'
 
     try:
-        next_check_time = parse(profile_summary.market_next_check_time)
+        next_check_time = datetime.fromisoformat(profile_summary.market_next_check_time)
         if next_check_time > datetime.now():
             next_check_time = profile_summary.market_next_check_time.split(' ')[1].split('.')[0]
         else:
@@ -129,21 +128,27 @@ st.markdown("<hr/>", unsafe_allow_html=True)
 
 try:
     transactions_df = pd.read_sql_query('select * from transactions order by sell_time desc', get_db_connection())
-    transactions_df['time_held'] = pd.to_timedelta(transactions_df['time_held']).dt.floor(freq='s').astype('string')
-    transactions_df['buy_time'] = pd.to_datetime(transactions_df['buy_time'])
-    transactions_df['sell_time'] = pd.to_datetime(transactions_df['sell_time'])
 
     open_columns = ["id", "buy_time", "symbol", "volume", "bought_at", "now_at", "change_perc", "profit_dollars",
                     "time_held", "tp_perc", "sl_perc", "buy_signal"]
-    open_trades = transactions_df.loc[transactions_df['closed'] == 0, open_columns]
+    open_trades = transactions_df.loc[transactions_df['closed'] == 0, open_columns].copy()
 
     closed_trades_columns = ["id", "buy_time", "symbol", "volume", "bought_at", "sold_at", "change_perc",
                              "profit_dollars", "sell_time", "time_held", "tp_perc", "sl_perc", "buy_signal",
                              "sell_reason"]
-    closed_trades = transactions_df.loc[transactions_df['closed'] == 1, closed_trades_columns]
+    closed_trades = transactions_df.loc[transactions_df['closed'] == 1, closed_trades_columns].copy()
 
+    # convert only the rows and columns that are rendered, with a fixed format instead of format inference
+    for trades in (open_trades, closed_trades):
+        trades['time_held'] = pd.to_timedelta(trades['time_held']).dt.floor(freq='s').astype('string')
+        trades['buy_time'] = pd.to_datetime(trades['buy_time'], format='ISO8601')
+    closed_trades['sell_time'] = pd.to_datetime(closed_trades['sell_time'], format='ISO8601')
+
+    change = open_trades['change_perc'].to_numpy()
+    winning = int((change > 0).sum())
+    losing = int((change <= 0).sum())
     st.markdown(
-        f"### **Open Trades (Winning: <span style='color:green;'>{open_trades[open_trades.change_perc > 0].change_perc.count()}</span> | Losing: <span style='color:red;'>{open_trades[open_trades.change_perc <= 0].change_perc.count()}</span>) **",
+        f"### **Open Trades (Winning: <span style='color:green;'>{winning}</span> | Losing: <span style='color:red;'>{losing}</span>) **",
         unsafe_allow_html=True)
     report_open_trades(open_trades)
     st.markdown("### **Closed Trades**")
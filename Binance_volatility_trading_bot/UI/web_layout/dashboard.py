@@ -0,0 +1,151 @@
+from datetime import datetime
+
+import streamlit as st
+
+from web_layout.utils import money_color, show_trades
+
+
+def render_current_session(profile_summary):
+    """
+    render the current session KPI row
+    Args:
+        profile_summary: parsed profile_summary.json
+
+    Returns:
+
+    """
+    pair_with = profile_summary.pair_with
+    realised_perc = profile_summary.realised_session_profit_incfees_perc
+    unrealised_perc = profile_summary.unrealised_session_profit_incfees_perc
+    total_perc = profile_summary.session_profit_incfees_total_perc
+
+    st.markdown("### **Current Session**")
+    kpi21, kpi22, kpi23 = st.columns(3)
+    with kpi21:
+        try:
+            started = profile_summary.started
+            start_date = datetime.fromisoformat(profile_summary.started)
+            run_for = str(datetime.now() - start_date).split(".")[0]
+        except:
+            started = "NA"
+            run_for = "NA"
+        market_perf_color = (
+            "red" if profile_summary.all_time_market_profit <= 0 else "green"
+        )
+        market_link = (
+            f'<a style="color: {market_perf_color}; text-decoration: none;" target="_blank" '
+            f'href="https://www.binance.com/en/trade/BTCUSDT">'
+            + str(profile_summary.all_time_market_profit)
+            + "</a>"
+        )
+        if profile_summary.bot_paused:
+            msg = "Buying Paused"
+            color = "red"
+        else:
+            msg = "Buying Enabled"
+            color = "green"
+
+        try:
+            next_check_time = datetime.fromisoformat(
+                profile_summary.market_next_check_time
+            )
+            if next_check_time > datetime.now():
+                next_check_time = profile_summary.market_next_check_time.split(" ")[
+                    1
+                ].split(".")[0]
+            else:
+                next_check_time = "NA"
+        except:
+            next_check_time = "NA"
+        st.markdown(
+            "\n".join(
+                [
+                    f"<h4 style='text-align: left; margin-left: 30px;'> Started: {started.split('.')[0]} | Running for: {run_for}</h4>",
+                    f"<h4 style='text-align: left; margin-left: 30px;'> Market Performance: <span style='text-align: center; color: {market_perf_color};'>{market_link}% </span> <span> (Since STARTED)</span></h3>",
+                    f"<h4 style='text-align: left;  margin-left: 30px;'><span style='color: {color};'>{msg}</span> "
+                    f"<span> | Next market check: {next_check_time} </span> </h4>",
+                ]
+            ),
+            unsafe_allow_html=True,
+        )
+
+    with kpi22:
+        st.markdown(
+            f"<h4 style='text-align: left;  margin-left: 30px;'>Current Trades: {profile_summary.current_holds}/{profile_summary.slots} "
+            f"({profile_summary.current_exposure}/{profile_summary.invstment_total} {pair_with})</h4>",
+            unsafe_allow_html=True,
+        )
+
+    with kpi23:
+        realised_color = money_color(realised_perc)
+        unrealised_color = money_color(unrealised_perc)
+        total_color = money_color(total_perc)
+        st.markdown(
+            "\n".join(
+                [
+                    f"<h4 style='text-align: left;  margin-left: 30px;'> Realised: &nbsp&nbsp&nbsp <span style='text-align: center; color: {realised_color};'>{realised_perc:.5f}% Est: ${profile_summary.realised_session_profit_incfees_total} {pair_with}</span></h3>",
+                    f"<h4 style='text-align: left;  margin-left: 30px;'> Unrealised: <span style='text-align: center; color: {unrealised_color};'>{unrealised_perc:.5f}% Est: ${profile_summary.unrealised_session_profit_incfees_total} {pair_with}</span></h3>",
+                    f"<h4 style='text-align: left;  margin-left: 30px;'> Total: &nbsp&nbsp&nbsp&nbsp&nbsp&nbsp&nbsp&nbsp&nbsp&nbsp&nbsp <span style='text-align: center; color: {total_color};'>{total_perc:.5f}% Est: ${profile_summary.session_profit_incfees_total} {pair_with}</span></h3>",
+                ]
+            ),
+            unsafe_allow_html=True,
+        )
+
+
+def render_all_time(profile_summary, strategy, stop_loss):
+    """
+    render the all time KPI row
+    Args:
+        profile_summary: parsed profile_summary.json
+        strategy: signalling module name shown next to the stop loss
+        stop_loss: configured STOP_LOSS
+
+    Returns:
+
+    """
+    st.markdown("### **All Time Data**")
+    kpi11, kpi12, kpi13 = st.columns(3)
+    with kpi11:
+        bot_perf_color = "red" if profile_summary.bot_profit_perc < 0 else "green"
+        st.markdown(
+            f"<h4 style='text-align: left; margin-left: 30px;'> Bot Performance: <span style='text-align: center; color: {bot_perf_color};'>{round(float(profile_summary.bot_profit_perc), 2)}%</span> <span> Est: </span><span style='color: {bot_perf_color}';>${profile_summary.bot_profit} {profile_summary.pair_with}</span></h3>",
+            unsafe_allow_html=True,
+        )
+
+    with kpi12:
+        st.markdown(
+            f"<h4 style='text-align: left;  margin-left: 30px; padding-right: 0px'> Completed Trades: {profile_summary.trade_wins + profile_summary.trade_losses} (Wins: <span style='color:green'>{profile_summary.trade_wins}</span>, Losses: <span style='color:red'>{profile_summary.trade_losses} </span>) | Win Ratio: {profile_summary.win_ratio}%</h4>",
+            unsafe_allow_html=True,
+        )
+
+    with kpi13:
+        st.markdown(
+            f"<h4 style='text-align: left;  margin-left: 30px; padding-right: 0px'> Strategy: {strategy} SL: {stop_loss}</h4>",
+            unsafe_allow_html=True,
+        )
+
+    st.markdown("<hr/>", unsafe_allow_html=True)
+
+
+def render_trades_tables(open_trades, closed_trades, **kwargs):
+    """
+    render the open and closed trades tables
+    Args:
+        open_trades: open trades dataframe
+        closed_trades: closed trades dataframe
+        **kwargs: passed through to st.dataframe
+
+    Returns:
+
+    """
+    change = open_trades["Change %"].to_numpy()
+    winning = int((change > 0).sum())
+    losing = len(change) - winning
+    st.markdown(
+        f"### **_Open Trades_** (Winning: <span style='color:green;'>{winning}</span> | Losing: <span style='color:red;'>{losing}</span>)",
+        unsafe_allow_html=True,
+    )
+    show_trades(open_trades, **kwargs)
+
+    st.markdown("### **_Closed Trades_**")
+    show_trades(closed_trades, **kwargs)
@@ -1,4 +1,183 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
 import streamlit as st
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+    print("libyaml not available, falling back to pure-Python YAML parser")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# the bot's sources are two levels up in a checkout, share its config cache
+BOT_PATH = str(Path(__file__).resolve().parents[2])
+if BOT_PATH not in sys.path:
+    sys.path.append(BOT_PATH)
+
+try:
+    from helpers.config_cache import invalidate_yaml_cache, load_yaml_cached
+except ImportError:
+    # UI deployed without the bot sources, parse config.yml on every load
+    invalidate_yaml_cache = load_yaml_cached = None
+
+
+def load_config(config_path):
+    """
+    load config.yml through the bot's shared JSON sidecar cache when it is
+    available
+    Args:
+        config_path: path to config.yml
+
+    Returns: parsed config dict
+
+    """
+    if load_yaml_cached:
+        return load_yaml_cached(config_path)
+    with open(config_path, "rb") as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
+def invalidate_config(config_path):
+    """
+    drop the cached config.yml parse after rewriting the file
+    Args:
+        config_path: path to config.yml
+
+    Returns:
+
+    """
+    if invalidate_yaml_cache:
+        invalidate_yaml_cache(config_path)
+
+
+# one connection per session thread, sqlite3 connections must not be shared
+_thread_db = threading.local()
+
+
+def connect_db(db_path):
+    """
+    open a long-lived read-only sqlite connection for the calling thread so
+    its page cache stays warm between dashboard refreshes; the bot owns the
+    database and its journal mode
+    Args:
+        db_path: path to the sqlite database file
+
+    Returns: sqlite3 connection
+
+    """
+    conns = getattr(_thread_db, "conns", None)
+    if conns is None:
+        conns = _thread_db.conns = {}
+    conn = conns.get(db_path)
+    if conn is not None:
+        return conn
+
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, cached_statements=256)
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conns[db_path] = conn
+    return conn
+
+
+OPEN_TRADES_QUERY = """
+SELECT ROW_NUMBER() OVER (ORDER BY sell_time DESC) AS "Id",
+       strftime('%Y-%m-%d %H:%M:%S', buy_time) AS "Buy Time",
+       symbol AS "Symbol",
+       volume AS "Volume",
+       bought_at AS "Bought at",
+       now_at AS "Now at",
+       change_perc AS "Change %",
+       profit_dollars AS "Profit $",
+       CASE WHEN instr(time_held, '.') > 0
+            THEN substr(time_held, 1, instr(time_held, '.') - 1)
+            ELSE time_held END AS "Time held",
+       tp_perc AS "TP %",
+       sl_perc AS "SL %",
+       buy_signal AS "Buy Signal"
+FROM transactions
+WHERE closed = 0
+ORDER BY sell_time DESC
+"""
+
+CLOSED_TRADES_QUERY = """
+SELECT ROW_NUMBER() OVER (ORDER BY sell_time DESC) AS "Id",
+       strftime('%Y-%m-%d %H:%M:%S', buy_time) AS "Buy Time",
+       symbol AS "Symbol",
+       volume AS "Volume",
+       bought_at AS "Bought at",
+       sold_at AS "Sold at",
+       change_perc AS "Change %",
+       profit_dollars AS "Profit $",
+       strftime('%Y-%m-%d %H:%M:%S', sell_time) AS "Sell time",
+       CASE WHEN instr(time_held, '.') > 0
+            THEN substr(time_held, 1, instr(time_held, '.') - 1)
+            ELSE time_held END AS "Time held",
+       tp_perc AS "TP %",
+       sl_perc AS "SL %",
+       buy_signal AS "Buy Signal",
+       sell_reason AS "Sell Reason"
+FROM transactions
+WHERE closed = 1
+ORDER BY sell_time DESC
+"""
+
+
+def _read_trades(query, conn):
+    cursor = conn.execute(query)
+    return pd.DataFrame.from_records(
+        cursor.fetchall(), columns=[column[0] for column in cursor.description]
+    )
+
+
+def load_trades(conn):
+    """
+    read open and closed trades already filtered, renamed and formatted by sqlite
+    Args:
+        conn: transactions db connection
+
+    Returns: (open_trades, closed_trades) dataframes
+
+    """
+    return (
+        _read_trades(OPEN_TRADES_QUERY, conn),
+        _read_trades(CLOSED_TRADES_QUERY, conn),
+    )
+
+
+@st.cache_data(ttl=3, max_entries=4)
+def _load_profile_summary(profile_summary_path, mtime):
+    raw = Path(profile_summary_path).read_bytes()
+    return SimpleNamespace(**(orjson.loads(raw) if orjson else json.loads(raw)))
+
+
+def load_profile_summary(profile_summary_path):
+    """
+    parse profile_summary.json, reusing the cached result while the file is unchanged
+    Args:
+        profile_summary_path: path to profile_summary.json
+
+    Returns: SimpleNamespace with the summary fields
+
+    """
+    return _load_profile_summary(
+        profile_summary_path, os.path.getmtime(profile_summary_path)
+    )
 
 
 def color_performance(column):
@@ -29,5 +208,57 @@ def color_negative_values(val):
     return 'color: %s' % color
 
 
+def color_negative_values_col(col):
+    return np.where(col.to_numpy() < 0, "color: red", "color: green")
+
+
 def gray_background(s):
-    return ['background-color: #333333' if i % 2 else '' for i in range(len(s))]
+    return np.where(np.arange(len(s)) & 1, "background-color: #333333", "")
+
+
+# above this many rows Styler html generation dominates, numbers are formatted client side instead
+STYLER_MAX_ROWS = 500
+
+TRADES_COLUMN_CONFIG = {
+    "Change %": st.column_config.NumberColumn(format="%.2f%%"),
+    "TP %": st.column_config.NumberColumn(format="%.2f%%"),
+    "SL %": st.column_config.NumberColumn(format="%.2f%%"),
+}
+
+
+def style_trades(trades):
+    """
+    build a fresh trades table Styler for one render; st.dataframe computes
+    the styles on every render anyway, and a Styler must not be shared
+    between session threads
+    Args:
+        trades: open or closed trades dataframe
+
+    Returns: pandas Styler
+
+    """
+    return (
+        trades.style.hide(axis="index")
+        .set_properties(subset=["Id"], **{"width": "100"})
+        .format("{:.2f}%", subset=["Change %", "TP %", "SL %"])
+        .apply(gray_background, axis=0)
+        .apply(color_negative_values_col, subset=["Change %", "Profit $"])
+    )
+
+
+def show_trades(trades, **kwargs):
+    """
+    render a trades table, skipping the Styler for large tables
+    Args:
+        trades: open or closed trades dataframe
+        **kwargs: passed through to st.dataframe
+
+    Returns:
+
+    """
+    if len(trades) > STYLER_MAX_ROWS:
+        st.dataframe(
+            trades, column_config=TRADES_COLUMN_CONFIG, hide_index=True, **kwargs
+        )
+    else:
+        st.dataframe(style_trades(trades), hide_index=True, **kwargs)
@@ -1,17 +1,33 @@
 # Standard library imports
+import json
+import os
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import sys
 from pathlib import Path
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
 
 # Third-party imports
 from colorama import init, Fore, Style
 from loguru import logger
+from tenacity import (
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    stop_when_event_set,
+    wait_exponential_jitter,
+)
 
 # Binance API imports
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceOrderException
-from requests.exceptions import ReadTimeout, ConnectionError, RequestException
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, RequestException
 
 # Local imports
 from configuration_manager import (
@@ -29,11 +45,39 @@ from reporting_manager import ReportingManager
 from notification_manager import NotificationManager
 from trading_engine import TradingEngine
 from helpers.db_interface import DbInterface
-from helpers.handle_creds import test_api_key
+from helpers.handle_creds import api_error_message
 from globals import user_data_path
 
-# Initialize colorama for colored console output
-init(autoreset=True)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Equivalent Binance REST clusters, raced at startup to pick the fastest one
+BINANCE_API_HOSTS = ("api", "api1", "api2", "api3")
+
+# Session state written on shutdown, resumed by a restart within the TTL
+WARM_STATE_PATH = Path(user_data_path) / ".warm_state.json"
+WARM_STATE_TTL = 60
+
+# Seconds a successful account check is trusted before get_account is repeated
+ACCOUNT_PROBE_TTL = 30
+
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """Make ``response.json()`` decode the body with orjson."""
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+@dataclass(frozen=True)
+class AccountProbeResult:
+    """Account state verified by _test_api_connection."""
+
+    can_trade: bool
+    account_type: Optional[str]
+    permissions: Tuple[str, ...]
+    endpoint: str
 
 
 # Custom exceptions for better error handling
@@ -70,6 +114,14 @@ class BinanceVolatilityBot:
         Sets up configuration, API client, database interface, and all trading modules
         in the correct order to ensure proper dependency injection.
         """
+        # Set by any shutdown path, wakes the main loop out of its cycle wait
+        self._shutdown_event = threading.Event()
+
+        # SIGINT/SIGTERM finish the current cycle, then shut down cleanly
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self._signal_shutdown)
+            signal.signal(signal.SIGTERM, self._signal_shutdown)
+
         # Configure Loguru logging
         self._setup_logging()
 
@@ -91,6 +143,7 @@ class BinanceVolatilityBot:
             # Initialize Binance API client with credentials
             api_key, api_secret = self.config_manager.get_api_credentials()
             self.client = Client(api_key, api_secret)
+            self._configure_http_session()
             logger.info("🔑 Binance API client initialized")
 
             # Initialize database interface
@@ -104,12 +157,33 @@ class BinanceVolatilityBot:
             # Initialize core trading components
             self._initialize_trading_components()
 
+            # Optional teardown hooks, resolved once for _cleanup
+            self._data_provider_shutdown = getattr(
+                self.data_provider, "shutdown", None
+            )
+            self._db_close = getattr(self.db_interface, "close", None)
+
             logger.success("🎯 All components initialized successfully")
 
-            self.shutdown_requested = False
             self.trading_paused = False
+            # Data shared between the steps of one cycle, reset at cycle start
+            self._cycle_ctx = {}
+            # Last successful account check, see _test_api_connection
+            self._account_probe = None
+            self._probe_cache_until = 0.0
+            # Fetches the cycle's prices while the trading step runs
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="cycle-io"
+            )
             self.start_time = datetime.now()
 
+            # Pings between cycles so Binance doesn't close the idle keep-alive
+            # connection; the session is already shared with the cycle-io pool
+            self._keepalive_thread = threading.Thread(
+                target=self._keepalive_loop, name="binance-keepalive", daemon=True
+            )
+            self._keepalive_thread.start()
+
         except (ConfigurationFileNotFoundError, CredentialsFileNotFoundError) as e:
             logger.error(f"📁 Configuration file missing: {e}")
             print(f"{Fore.RED}Configuration Error: {e}{Style.RESET_ALL}")
@@ -129,6 +203,28 @@ class BinanceVolatilityBot:
             logger.exception(f"💥 Failed to initialize bot: {e}")
             raise
 
+    @property
+    def shutdown_requested(self) -> bool:
+        """Whether a shutdown has been requested."""
+        return self._shutdown_event.is_set()
+
+    @shutdown_requested.setter
+    def shutdown_requested(self, value: bool):
+        if value:
+            self._shutdown_event.set()
+        else:
+            self._shutdown_event.clear()
+
+    def _signal_shutdown(self, signum, frame):
+        """
+        Request a graceful shutdown from SIGINT/SIGTERM.
+
+        A second SIGINT while shutting down falls back to KeyboardInterrupt.
+        """
+        if signum == signal.SIGINT and self._shutdown_event.is_set():
+            raise KeyboardInterrupt
+        self._shutdown_event.set()
+
     def _setup_logging(self):
         """
         Configure Loguru logging with multiple outputs and formatting.
@@ -139,13 +235,11 @@ class BinanceVolatilityBot:
         # Create logs directory if it doesn't exist
         Path("logs").mkdir(exist_ok=True)
 
-        # Console output with colors and icons
+        # Console output with colors; call sites are only kept in the files
         logger.add(
             sys.stdout,
             level="INFO",
-            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-            "<level>{level: <8}</level> | "
-            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+            format="<green>{time:HH:mm:ss}</green> <level>{level: <8}</level> "
             "<level>{message}</level>",
             colorize=True,
         )
@@ -158,6 +252,9 @@ class BinanceVolatilityBot:
             rotation="10 MB",
             retention="7 days",
             compression="zip",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
         )
 
         # Error log file for critical issues
@@ -168,20 +265,50 @@ class BinanceVolatilityBot:
             rotation="5 MB",
             retention="30 days",
             compression="zip",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
         )
 
-        # Trading operations log
+        # Trading operations log, fed by loggers bound with channel="trade"
         logger.add(
             "logs/trading_operations.log",
             level="INFO",
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
-            filter=lambda record: "trade" in record["message"].lower()
-            or "buy" in record["message"].lower()
-            or "sell" in record["message"].lower(),
+            filter=lambda record: record["extra"].get("channel") == "trade",
             rotation="1 day",
             retention="30 days",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
         )
 
+    def _configure_http_session(self):
+        """
+        Size the Binance client's connection pool, ask for keep-alive
+        connections and decode responses with orjson when it is installed.
+
+        A larger pool avoids dropping TLS connections on overflow. The idle
+        connection is kept warm by _keepalive_loop, started once __init__
+        has succeeded.
+        """
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        self.client.session.mount("https://", adapter)
+        self.client.session.mount("http://", adapter)
+        self.client.session.headers["Connection"] = "keep-alive"
+
+        # python-binance decodes every response through response.json()
+        if orjson is not None:
+            self.client.session.hooks["response"].append(_orjson_response_hook)
+
+    def _keepalive_loop(self, interval: int = 30):
+        """Ping the Binance API every `interval` seconds until shutdown."""
+        while not self._shutdown_event.wait(timeout=interval):
+            try:
+                self.client.ping()
+            except Exception as e:
+                logger.debug(f"🌐 Keep-alive ping failed: {e}")
+
     def _initialize_trading_components(self):
         """
         Initialize all trading-related components with proper dependency injection.
@@ -264,42 +391,47 @@ class BinanceVolatilityBot:
             # Send startup notification
             self.notification_manager.send_bot_startup_notification()
 
+            # Reports are only generated every `report_every_cycles` cycles
+            report_every = max(1, int(self.config.get("report_every_cycles", 2)))
+            cycle_counter = 0
+
+            # Config is static after load, so hoist loop invariants into locals
+            engine = self.trading_engine
+            shutdown_event = self._shutdown_event
+            cycle_interval = self.config.get("cycle_interval", 60)
+
             # Main trading loop
-            while self.trading_engine.is_running and not self.shutdown_requested:
+            while engine.is_running and not shutdown_event.is_set():
                 try:
-                    # Check shutdown flag at start of each cycle
-                    if self.shutdown_requested:
-                        logger.info("🛑 Shutdown requested - breaking main loop")
-                        break
-
-                    if not getattr(self, "trading_paused", False):
+                    self.data_provider.invalidate_price_cache()
+                    self._cycle_ctx = {
+                        "prices_future": self._io_pool.submit(
+                            self.data_provider.get_price, add_to_historical=False
+                        )
+                    }
+
+                    if not self.trading_paused:
                         self._execute_trading_cycle()
                     else:
                         logger.debug("⏸️ Trading paused - skipping cycle")
 
                     # Generate and process reports
-                    self._process_reports()
+                    if cycle_counter % report_every == 0:
+                        self._process_reports()
+                    cycle_counter += 1
 
                     # Check session limits and trading rules
                     if self._check_session_limits():
                         break
 
-                    # Check shutdown flag before sleep
-                    if self.shutdown_requested:
-                        logger.info("🛑 Shutdown requested - skipping sleep")
-                        break
-
-                    # Wait before next cycle
-                    cycle_interval = self.config.get("cycle_interval", 60)
+                    # Wait before next cycle, returns at once if shutdown is set
                     logger.debug(
                         f"⏱️ Waiting {cycle_interval} seconds before next cycle"
                     )
 
-                    for _ in range(cycle_interval):
-                        if self.shutdown_requested:
-                            logger.info("🛑 Shutdown requested during sleep - breaking")
-                            break
-                        time.sleep(1)
+                    if shutdown_event.wait(timeout=cycle_interval):
+                        logger.info("🛑 Shutdown requested - breaking main loop")
+                        break
 
                 except BinanceAPIException as e:
                     self._handle_binance_api_error(e)
@@ -362,16 +494,38 @@ class BinanceVolatilityBot:
         except Exception as e:
             logger.error(f"💥 Error updating position prices: {e}")
 
+    def _get_cycle_prices(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the prices fetched for this cycle.
+
+        The request is started in the background at the top of the cycle so
+        it overlaps the trading step. The snapshot is appended to the
+        volatility history here, on the main thread, so readers of the
+        history never race the write and every cycle records one sample.
+        """
+        prices = self._cycle_ctx.get("prices")
+        if prices is None:
+            future = self._cycle_ctx.get("prices_future")
+            if future is not None:
+                prices = future.result()
+            else:
+                prices = self.data_provider.get_price(add_to_historical=False)
+            self.data_provider.record_prices(prices)
+            self._cycle_ctx["prices"] = prices
+        return prices
+
     def _process_reports(self):
         """Generate portfolio reports and send notifications."""
         try:
             portfolio_summary = self.portfolio_manager.get_portfolio_summary()
-            current_prices = self.data_provider.get_price()
+            current_prices = self._get_cycle_prices()
 
             # Generate report using summary
             balance_report = self.reporting_manager.generate_balance_report(
                 portfolio_summary, current_prices
             )
+            self._cycle_ctx["portfolio_summary"] = portfolio_summary
+            self._cycle_ctx["balance_report"] = balance_report
             # Log portfolio manager data
             logger.info(
                 f"📊 Portfolio: {portfolio_summary.get('active_positions', 0)} positions, "
@@ -393,12 +547,13 @@ class BinanceVolatilityBot:
             bool: True if session should be terminated, False otherwise
         """
         try:
-            # Get current session profit from latest report
-            portfolio_status = self.portfolio_manager.get_portfolio_status()
-            current_prices = self.data_provider.get_price()
-            report = self.reporting_manager.generate_balance_report(
-                portfolio_status, current_prices
-            )
+            # Get current session profit from this cycle's report if one was made
+            report = self._cycle_ctx.get("balance_report")
+            if report is None:
+                portfolio_status = self.portfolio_manager.get_portfolio_status()
+                report = self.reporting_manager.generate_balance_report(
+                    portfolio_status, self._get_cycle_prices()
+                )
 
             # Check session limits
             session_status = self.risk_manager.check_session_limits(
@@ -429,6 +584,9 @@ class BinanceVolatilityBot:
         try:
             logger.info("🔧 Initializing bot components...")
 
+            # Pin the client to the fastest responding endpoint
+            self._select_fastest_endpoint()
+
             # Test API connection first
             self._test_api_connection()
 
@@ -436,15 +594,23 @@ class BinanceVolatilityBot:
             self.data_provider.initialize_historical_data()
             logger.info("📊 Historical data initialized")
 
-            # Seed initial prices
-            self.data_provider.get_price(add_to_historical=True)
-
-            # Load existing open positions
-            self.portfolio_manager.load_open_positions()
-            logger.info("💼 Open positions loaded")
-
-            # Initialize session statistics
-            self.reporting_manager.initialize_session_stats()
+            # Resume the session after a quick restart, otherwise start a new one
+            if not self._restore_warm_state():
+                self.reporting_manager.initialize_session_stats()
+
+            # Seed initial prices (REST) while open positions load (DB/disk)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = {
+                    pool.submit(
+                        self.data_provider.get_price, add_to_historical=True
+                    ): "💹 Initial prices seeded",
+                    pool.submit(
+                        self.portfolio_manager.load_open_positions
+                    ): "💼 Open positions loaded",
+                }
+                for future in as_completed(futures):
+                    future.result()
+                    logger.info(futures[future])
 
             logger.success("✅ All components initialized successfully")
 
@@ -452,56 +618,151 @@ class BinanceVolatilityBot:
             logger.exception(f"💥 Component initialization failed: {e}")
             raise
 
-    def _test_api_connection(self):
+    def _save_warm_state(self):
+        """Persist session statistics so a quick restart resumes the session."""
+        session_start_time = self.reporting_manager.session_start_time
+        if session_start_time is None:
+            return
+
+        # start_time duplicates session_start_time and is rebuilt on restore
+        session_stats = {
+            key: value
+            for key, value in self.reporting_manager.session_stats.items()
+            if key != "start_time"
+        }
+        state = {
+            "session_start_time": session_start_time.isoformat(),
+            "session_stats": session_stats,
+            "ts": time.time(),
+        }
+        try:
+            tmp_path = WARM_STATE_PATH.with_suffix(".tmp")
+            with open(tmp_path, "w") as file:
+                json.dump(state, file)
+            os.replace(tmp_path, WARM_STATE_PATH)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Could not save warm start state: {e}")
+
+    def _restore_warm_state(self) -> bool:
+        """
+        Resume session statistics saved by the previous shutdown.
+
+        The state file is consumed on read, so it is only used once.
+
+        Returns:
+            bool: True if a fresh state was restored
+        """
+        try:
+            with open(WARM_STATE_PATH) as file:
+                state = json.load(file)
+            WARM_STATE_PATH.unlink()
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable warm start state: {e}")
+            return False
+
+        # Missing or malformed fields mean there is no state to resume
+        try:
+            saved_at = float(state["ts"])
+            session_start_time = datetime.fromisoformat(state["session_start_time"])
+            session_stats = dict(state["session_stats"])
+        except (KeyError, TypeError, ValueError):
+            logger.warning("⚠️ Ignoring incomplete warm start state")
+            return False
+
+        if time.time() - saved_at >= WARM_STATE_TTL:
+            return False
+
+        session_stats["start_time"] = session_start_time
+        self.reporting_manager.session_start_time = session_start_time
+        self.reporting_manager.session_stats = session_stats
+        logger.info(
+            f"♻️ Resumed session started at {session_start_time:%Y-%m-%d %H:%M:%S}"
+        )
+        return True
+
+    def _select_fastest_endpoint(self):
+        """
+        Race a ping against every Binance REST cluster and pin the client
+        to the first one that answers.
+
+        Keeps the current endpoint when none of them respond.
+        """
+
+        def ping(host: str) -> str:
+            response = requests.get(f"https://{host}.binance.com/api/v3/ping", timeout=2)
+            response.raise_for_status()
+            return host
+
+        executor = ThreadPoolExecutor(max_workers=len(BINANCE_API_HOSTS))
+        try:
+            futures = [executor.submit(ping, host) for host in BINANCE_API_HOSTS]
+            for future in as_completed(futures):
+                try:
+                    best = future.result()
+                except RequestException:
+                    continue
+                self.client.API_URL = f"https://{best}.binance.com/api"
+                logger.info(f"🏁 Using fastest Binance endpoint: {best}.binance.com")
+                return
+            logger.warning("⚠️ No Binance endpoint answered the ping race")
+        finally:
+            # Don't wait for the slower hosts
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _probe_account_once(self) -> AccountProbeResult:
+        """
+        Fetch the account once and reduce it to the fields the bot checks.
+
+        Returns:
+            AccountProbeResult: Trading flag, account type and permissions
+
+        Raises:
+            ValueError: When the API response format is invalid
+        """
+        account_info = self.client.get_account()
+        if not account_info or not isinstance(account_info, dict):
+            raise ValueError("Invalid API response - check API configuration")
+
+        return AccountProbeResult(
+            can_trade=bool(account_info.get("canTrade", False)),
+            account_type=account_info.get("accountType"),
+            permissions=tuple(account_info.get("permissions", ())),
+            endpoint=self.client.API_URL,
+        )
+
+    def _test_api_connection(self) -> AccountProbeResult:
         """
         Test connection to Binance API and verify credentials.
 
+        A successful account check is reused for ACCOUNT_PROBE_TTL seconds;
+        within that window only connectivity is re-tested, with a ping.
+
+        Returns:
+            AccountProbeResult: The verified account state
+
         Raises:
-            BinanceAPIException: When Binance API returns an error
-            APIConnectionError: When network connection fails
+            APIConnectionError: When the API or the network fails
             APIPermissionError: When API key lacks trading permissions
             ValueError: When API response format is invalid
         """
         try:
-            logger.info("🔍 Testing Binance API connection...")
-            success, message = test_api_key(self.client, BinanceAPIException)
-            if not success:
-                raise APIConnectionError(f"API key validation failed: {message}")
-
-            # Get account info for additional permission checks
-            account_info = self.client.get_account()
-
-            # Validate response structure
-            if not account_info or not isinstance(account_info, dict):
-                raise ValueError("Invalid API response - check API configuration")
-
-            # Check trading permissions
-            can_trade = account_info.get("canTrade", False)
-            if not can_trade:
-                permissions = account_info.get("permissions", [])
-                raise APIPermissionError(
-                    f"API key lacks trading permissions. "
-                    f"Current permissions: {permissions}. "
-                    f"Please enable SPOT trading in your Binance API settings."
-                )
+            probe = self._account_probe
+            if probe is not None and time.monotonic() < self._probe_cache_until:
+                self.client.ping()
+                logger.info(f"🔗 API reachable via {self.client.API_URL}")
+                return probe
 
-            # Check account status
-            account_status = account_info.get("accountType")
-            if account_status != "SPOT":
-                raise APIPermissionError(
-                    f"Account type '{account_status}' not supported for spot trading"
-                )
-
-            logger.success(f"🔗 API connection successful - {message}")
-            logger.info(f"Account type: {account_status}, Trading enabled: {can_trade}")
+            logger.info("🔍 Testing Binance API connection...")
+            probe = self._probe_account_once()
 
         except BinanceAPIException as e:
-            error_msg = f"Binance API error [{getattr(e, 'code', 'Unknown')}]: {e}"
+            error_msg = f"Binance API error [{e.code}]: {api_error_message(e)}"
             logger.error(f"🔴 {error_msg}")
             raise APIConnectionError(error_msg) from e
 
-        except (APIPermissionError, ValueError):
-            # Re-raise our custom exceptions
+        except ValueError:
             raise
 
         except (ConnectionError, RequestException) as e:
@@ -514,6 +775,25 @@ class BinanceVolatilityBot:
             logger.exception(f"💥 {error_msg}")
             raise APIConnectionError(error_msg) from e
 
+        if not probe.can_trade:
+            raise APIPermissionError(
+                f"API key lacks trading permissions. "
+                f"Current permissions: {list(probe.permissions)}. "
+                f"Please enable SPOT trading in your Binance API settings."
+            )
+        if probe.account_type != "SPOT":
+            raise APIPermissionError(
+                f"Account type '{probe.account_type}' not supported for spot trading"
+            )
+
+        self._account_probe = probe
+        self._probe_cache_until = time.monotonic() + ACCOUNT_PROBE_TTL
+        logger.success("🔗 API connection successful - API key validated successfully")
+        logger.info(
+            f"Account type: {probe.account_type}, Trading enabled: {probe.can_trade}"
+        )
+        return probe
+
     def _handle_session_limit(self, session_status: str):
         """
         Handle session limit events (take profit or stop loss).
@@ -587,37 +867,36 @@ class BinanceVolatilityBot:
         # Log error
         self.reporting_manager.log_error(error_msg)
 
-        # Implement exponential backoff for network errors
-        retry_delay = 30  # Start with 30 seconds
-        max_retries = 3
-
-        for attempt in range(max_retries):
-            logger.info(
-                f"🔄 Retrying connection in {retry_delay} seconds (attempt {attempt + 1}/{max_retries})"
-            )
-            time.sleep(retry_delay)
-
-            try:
-                # Test connection
-                self._test_api_connection()
-                logger.success("✅ Connection restored successfully")
-                return
+        # Probe with jittered exponential backoff, waking early on shutdown
+        max_retries = 6
+        retryable = (APIConnectionError, ConnectionError, RequestException)
+        retrying = Retrying(
+            wait=wait_exponential_jitter(initial=1, max=30),
+            stop=stop_after_attempt(max_retries)
+            | stop_when_event_set(self._shutdown_event),
+            retry=retry_if_exception_type(retryable),
+            sleep=self._shutdown_event.wait,
+            before_sleep=lambda state: logger.warning(
+                f"🔄 Retry attempt {state.attempt_number}/{max_retries} failed: "
+                f"{state.outcome.exception()} - retrying in {state.next_action.sleep:.1f}s"
+            ),
+            reraise=True,
+        )
 
-            except BinanceAPIException as e:
-                logger.warning(
-                    f"⚠️ Retry attempt {attempt + 1} failed with API error: {e}"
-                )
-                retry_delay *= 2  # Exponential backoff
+        try:
+            # Each probe re-races the clusters, evicting a slow or unreachable one
+            retrying(self._probe_api)
+            logger.success("✅ Connection restored successfully")
 
-            except (ConnectionError, ReadTimeout, RequestException) as e:
-                logger.warning(
-                    f"🌐 Retry attempt {attempt + 1} failed with network error: {e}"
-                )
-                retry_delay *= 2  # Exponential backoff
+        except retryable:
+            # If all retries failed, stop the bot
+            logger.error("💥 All connection retry attempts failed - stopping bot")
+            self.trading_engine.is_running = False
 
-        # If all retries failed, stop the bot
-        logger.error("💥 All connection retry attempts failed - stopping bot")
-        self.trading_engine.is_running = False
+    def _probe_api(self):
+        """Pin the fastest Binance cluster and verify the connection on it."""
+        self._select_fastest_endpoint()
+        self._test_api_connection()
 
     def _handle_general_error(self, exception: Exception):
         """
@@ -665,12 +944,20 @@ class BinanceVolatilityBot:
             )
             logger.info("🧹 Starting cleanup operations")
 
+            # Drop a price fetch that is still in flight
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+
+            # Stop the keep-alive pings
+            self._shutdown_event.set()
+            self._keepalive_thread.join(timeout=5)
+
             # Stop external signal modules
-            if hasattr(self.data_provider, "shutdown"):
-                self.data_provider.shutdown()
+            if self._data_provider_shutdown:
+                self._data_provider_shutdown()
 
             # Save current portfolio state
             self.portfolio_manager.save_current_state()
+            self._save_warm_state()
             logger.info("💾 Portfolio state saved")
 
             # Generate final trading report
@@ -678,18 +965,24 @@ class BinanceVolatilityBot:
             logger.info("📊 Final report generated")
 
             # Close database connections
-            if hasattr(self.db_interface, "close"):
-                self.db_interface.close()
+            if self._db_close:
+                self._db_close()
                 logger.info("🔌 Database connections closed")
 
             logger.success("✅ Bot shutdown completed successfully")
             logger.success("✅ Cleanup completed successfully")
 
+            # Drain the enqueued file sinks before the process exits
+            logger.complete()
+
         except Exception as e:
             logger.exception(f"💥 Error during cleanup: {e}")
 
 
 if __name__ == "__main__":
+    # Initialize colorama for colored console output
+    init(autoreset=True)
+
     try:
         bot = BinanceVolatilityBot()
         bot.run()
@@ -1,8 +1,35 @@
 # configuration_manager.py
+import copy
+import re
+import sys
 import yaml
 import os
 from typing import Dict, Any, Tuple
 from globals import user_data_path
+from helpers.config_cache import (
+    invalidate_yaml_cache,
+    load_yaml_cached,
+    yaml_cache_path,
+)
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Matches an option's "KEY: value  # comment" line, keeping indent and comment
+TRADING_OPTION_LINE_RES = {
+    key: re.compile(
+        rb"^([ \t]*" + key.encode() + rb"[ \t]*:[ \t]*)[^#\r\n]*?([ \t]*(?:#[^\r\n]*)?)$",
+        re.MULTILINE,
+    )
+    for key in ("TAKE_PROFIT", "STOP_LOSS")
+}
+
+# trading_options keys that validate_configuration() requires
+REQUIRED_TRADING_OPTIONS = frozenset(
+    {"PAIR_WITH", "TRADE_TOTAL", "TRADE_SLOTS", "STOP_LOSS", "TAKE_PROFIT"}
+)
 
 
 class ConfigurationError(Exception):
@@ -50,8 +77,24 @@ class IncompleteCredentialsError(CredentialsError):
 class ConfigurationManager:
     """
     Manages configuration loading and validation for the trading bot.
+
+    The configuration file is loaded when the manager is created. The
+    credentials file is only read on the first get_api_credentials() or
+    get_telegram_credentials() call, so its errors surface there.
     """
 
+    __slots__ = (
+        "config_file",
+        "creds_file",
+        "config_data",
+        "credentials",
+        "_trading_config",
+        "_script_options",
+        "_db_filename",
+        "_api_credentials",
+        "_telegram_credentials",
+    )
+
     def __init__(self, config_file: str, creds_file: str):
         """
         Initialize configuration manager with file paths.
@@ -63,18 +106,22 @@ class ConfigurationManager:
         Raises:
             ConfigurationFileNotFoundError: When config file doesn't exist
             ConfigurationLoadError: When config file cannot be loaded
-            CredentialsFileNotFoundError: When credentials file doesn't exist
-            CredentialsLoadError: When credentials file cannot be loaded
+            ConfigurationError: When a config section is missing or malformed
         """
         self.config_file = config_file
         self.creds_file = creds_file
         self.config_data = None
         self.credentials = None
+
+        # Sections checked once at load and returned as-is by the getters
         self._trading_config = None
+        self._script_options = None
+        self._db_filename = None
+        self._api_credentials = None
+        self._telegram_credentials = None
 
-        # Load configuration files
+        # Credentials are loaded on first use
         self._load_configuration()
-        self._load_credentials()
 
     def _load_configuration(self):
         """
@@ -85,13 +132,7 @@ class ConfigurationManager:
             ConfigurationLoadError: When config file cannot be parsed
         """
         try:
-            if not os.path.exists(self.config_file):
-                raise ConfigurationFileNotFoundError(
-                    f"Configuration file not found: {self.config_file}. Please create the file or check the path."
-                )
-
-            with open(self.config_file, "r", encoding="utf-8") as file:
-                self.config_data = yaml.safe_load(file)
+            self.config_data = self._load_yaml_cached(self.config_file)
 
             # Validate that config was loaded successfully
             if self.config_data is None:
@@ -99,9 +140,10 @@ class ConfigurationManager:
                     f"Configuration file is empty or invalid: {self.config_file}"
                 )
 
-        except ConfigurationFileNotFoundError:
-            # Re-raise our custom exceptions
-            raise
+        except FileNotFoundError as e:
+            raise ConfigurationFileNotFoundError(
+                f"Configuration file not found: {self.config_file}. Please create the file or check the path."
+            ) from e
 
         except yaml.YAMLError as e:
             raise ConfigurationLoadError(
@@ -118,10 +160,71 @@ class ConfigurationManager:
                 f"OS error reading configuration file {self.config_file}: {e}"
             ) from e
 
-        except Exception as e:
-            raise ConfigurationLoadError(
-                f"Unexpected error loading configuration from {self.config_file}: {e}"
-            ) from e
+        self._index_configuration()
+
+    def _index_configuration(self):
+        """
+        Check the configuration structure once and keep its sections.
+
+        Raises:
+            ConfigurationError: When the configuration or a section is malformed
+        """
+        try:
+            if not isinstance(self.config_data, dict):
+                raise ConfigurationError(
+                    "Invalid configuration format. Expected dictionary structure."
+                )
+
+            trading_options = self.config_data.get("trading_options")
+            if trading_options is None:
+                raise ConfigurationError(
+                    "Missing 'trading_options' section in configuration file. Please check your config.yml structure."
+                )
+
+            if not isinstance(trading_options, dict):
+                raise ConfigurationError(
+                    "Invalid 'trading_options' format. Expected dictionary structure."
+                )
+
+            script_options = self.config_data.get("script_options", {})
+            if not isinstance(script_options, dict):
+                raise ConfigurationError(
+                    "Invalid 'script_options' format. Expected dictionary structure."
+                )
+
+        except ConfigurationError:
+            self._invalidate_config_cache()
+            raise
+
+        self._trading_config = trading_options
+        self._script_options = script_options
+
+        data_options = self.config_data.get("data_options")
+        if isinstance(data_options, dict):
+            db_filename = data_options.get(
+                "DB_TRANSACTIONS_FILE_NAME", "transactions.db"
+            )
+            self._db_filename = f"{user_data_path}/{db_filename}"
+
+    # Kept on the class for callers that locate the cache file
+    _yaml_cache_path = staticmethod(yaml_cache_path)
+
+    def _load_yaml_cached(self, path: str):
+        """
+        Load a YAML file, reusing earlier parses while the file is unchanged.
+
+        Args:
+            path (str): Path to the YAML file
+
+        Returns:
+            Any: Parsed YAML content, a private copy so edits by one manager
+            never leak into the cache or other managers
+        """
+        return load_yaml_cached(path)
+
+    def _invalidate_config_cache(self):
+        """Drop the cached parses of the configuration file."""
+        invalidate_yaml_cache(self.config_file)
 
     def _load_credentials(self):
         """
@@ -132,14 +235,8 @@ class ConfigurationManager:
             CredentialsLoadError: When credentials file cannot be parsed
         """
         try:
-            if not os.path.exists(self.creds_file):
-                raise CredentialsFileNotFoundError(
-                    f"Credentials file not found: {self.creds_file}. "
-                    f"Please create the file with your Binance API credentials."
-                )
-
-            with open(self.creds_file, "r", encoding="utf-8") as file:
-                self.credentials = yaml.safe_load(file)
+            with open(self.creds_file, "rb") as file:
+                self.credentials = yaml.load(file.read(), Loader=SafeLoader)
 
             # Validate that credentials were loaded successfully
             if self.credentials is None:
@@ -147,9 +244,11 @@ class ConfigurationManager:
                     f"Credentials file is empty or invalid: {self.creds_file}"
                 )
 
-        except CredentialsFileNotFoundError:
-            # Re-raise our custom exceptions
-            raise
+        except FileNotFoundError as e:
+            raise CredentialsFileNotFoundError(
+                f"Credentials file not found: {self.creds_file}. "
+                f"Please create the file with your Binance API credentials."
+            ) from e
 
         except yaml.YAMLError as e:
             raise CredentialsLoadError(
@@ -166,44 +265,13 @@ class ConfigurationManager:
                 f"OS error reading credentials file {self.creds_file}: {e}"
             ) from e
 
-        except Exception as e:
-            raise CredentialsLoadError(
-                f"Unexpected error loading credentials from {self.creds_file}: {e}"
-            ) from e
-
     def get_trading_config(self) -> Dict[str, Any]:
         """
         Get trading configuration parameters.
 
         Returns:
-            Dict[str, Any]: Trading configuration dictionary
-
-        Raises:
-            ConfigurationError: When configuration is not loaded or invalid
+            Dict[str, Any]: Trading configuration dictionary, checked at load
         """
-        if self._trading_config is None:
-            if not self.config_data:
-                raise ConfigurationError(
-                    "Configuration not loaded. Ensure configuration file was loaded successfully."
-                )
-
-            if not isinstance(self.config_data, dict):
-                raise ConfigurationError(
-                    "Invalid configuration format. Expected dictionary structure."
-                )
-
-            trading_options = self.config_data.get("trading_options")
-            if trading_options is None:
-                raise ConfigurationError(
-                    "Missing 'trading_options' section in configuration file. Please check your config.yml structure."
-                )
-
-            if not isinstance(trading_options, dict):
-                raise ConfigurationError(
-                    "Invalid 'trading_options' format. Expected dictionary structure."
-                )
-            self._trading_config = trading_options
-
         return self._trading_config
 
     def get_telegram_credentials(self) -> Tuple[str, str]:
@@ -214,8 +282,19 @@ class ConfigurationManager:
             Tuple[str, str]: API key and chat ID
 
         Raises:
+            CredentialsFileNotFoundError: When credentials file doesn't exist
+            CredentialsLoadError: When credentials file cannot be loaded
             IncompleteCredentialsError: When credentials are missing or invalid
         """
+        if self._telegram_credentials is None:
+            self._telegram_credentials = self._validate_telegram_credentials()
+        return self._telegram_credentials
+
+    def _validate_telegram_credentials(self) -> Tuple[str, str]:
+        """Load credentials if needed and check the telegram section once."""
+        if self.credentials is None:
+            self._load_credentials()
+
         if not self.credentials:
             raise CredentialsError("Credentials data not loaded")
 
@@ -233,7 +312,7 @@ class ConfigurationManager:
                 "Missing or invalid 'TELEGRAM_CHAT_ID' in credentials file under 'telegram' section."
             )
 
-        return token.strip(), chat_id.strip()
+        return sys.intern(token.strip()), sys.intern(chat_id.strip())
 
     def get_api_credentials(self) -> Tuple[str, str]:
         """
@@ -243,9 +322,20 @@ class ConfigurationManager:
             Tuple[str, str]: API key and secret
 
         Raises:
+            CredentialsFileNotFoundError: When credentials file doesn't exist
+            CredentialsLoadError: When credentials file cannot be loaded
             CredentialsError: When credentials are not loaded
             IncompleteCredentialsError: When credentials are missing or invalid
         """
+        if self._api_credentials is None:
+            self._api_credentials = self._validate_api_credentials()
+        return self._api_credentials
+
+    def _validate_api_credentials(self) -> Tuple[str, str]:
+        """Load credentials if needed and check the Binance API key once."""
+        if self.credentials is None:
+            self._load_credentials()
+
         if not self.credentials:
             raise CredentialsError(
                 "Credentials not loaded. Ensure credentials file was loaded successfully."
@@ -281,16 +371,13 @@ class ConfigurationManager:
                 "Invalid API secret format. API secret must be a non-empty string."
             )
 
-        return api_key.strip(), api_secret.strip()
+        return sys.intern(api_key.strip()), sys.intern(api_secret.strip())
 
     def get_db_filename(self) -> str:
         """Get database filename from configuration."""
-        if not self.config_data or "data_options" not in self.config_data:
+        if self._db_filename is None:
             raise ConfigurationError("Missing 'data_options' in config.yml")
-        db_filename = self.config_data["data_options"].get(
-            "DB_TRANSACTIONS_FILE_NAME", "transactions.db"
-        )
-        return f"{user_data_path}/{db_filename}"
+        return self._db_filename
 
     def validate_configuration(self) -> bool:
         """
@@ -302,36 +389,15 @@ class ConfigurationManager:
         Raises:
             ConfigurationError: When required configuration is missing
         """
-        try:
-            config = self.get_trading_config()
-
-            # List of required configuration parameters
-            required_params = [
-                "PAIR_WITH",
-                "TRADE_TOTAL",
-                "TRADE_SLOTS",
-                "STOP_LOSS",
-                "TAKE_PROFIT",
-            ]
-
-            missing_params = []
-            for param in required_params:
-                if param not in config:
-                    missing_params.append(param)
-
-            if missing_params:
-                raise ConfigurationError(
-                    f"Missing required configuration parameters: {', '.join(missing_params)}. "
-                    f"Please check your config.yml file."
-                )
-
-            return True
-
-        except ConfigurationError:
-            raise
+        missing_params = REQUIRED_TRADING_OPTIONS - self._trading_config.keys()
+        if missing_params:
+            self._invalidate_config_cache()
+            raise ConfigurationError(
+                f"Missing required configuration parameters: {', '.join(sorted(missing_params))}. "
+                f"Please check your config.yml file."
+            )
 
-        except Exception as e:
-            raise ConfigurationError(f"Configuration validation failed: {e}") from e
+        return True
 
     def get_config_value(self, key: str):
         """
@@ -342,50 +408,17 @@ class ConfigurationManager:
 
         Returns:
             Any: Configuration value
-
-        Raises:
-            ConfigurationError: When configuration is not loaded
         """
-        try:
-            config = self.get_trading_config()
-            return config.get(key)
-
-        except ConfigurationError:
-            raise
-
-        except Exception as e:
-            raise ConfigurationError(
-                f"Error retrieving config value '{key}': {e}"
-            ) from e
+        return self._trading_config.get(key)
 
     def get_script_options(self) -> Dict[str, Any]:
         """
         Get script configuration parameters.
 
         Returns:
-            Dict[str, Any]: Script options dictionary
-
-        Raises:
-            ConfigurationError: When configuration is not loaded or invalid
+            Dict[str, Any]: Script options dictionary, checked at load
         """
-        if not self.config_data:
-            raise ConfigurationError(
-                "Configuration not loaded. Ensure configuration file was loaded successfully."
-            )
-
-        if not isinstance(self.config_data, dict):
-            raise ConfigurationError(
-                "Invalid configuration format. Expected dictionary structure."
-            )
-
-        script_options = self.config_data.get("script_options", {})
-
-        if not isinstance(script_options, dict):
-            raise ConfigurationError(
-                "Invalid 'script_options' format. Expected dictionary structure."
-            )
-
-        return script_options
+        return self._script_options
 
     def get_script_option(self, key: str, default=None):
         """
@@ -397,21 +430,43 @@ class ConfigurationManager:
 
         Returns:
             Any: Script option value or default
+        """
+        return self._script_options.get(key, default)
 
-        Raises:
-            ConfigurationError: When configuration is not loaded
+    def _write_trading_option(self, key: str, value: float):
         """
-        try:
-            script_options = self.get_script_options()
-            return script_options.get(key, default)
+        Rewrite a single trading option scalar in config_file.
 
-        except ConfigurationError:
-            raise
+        Only the value on the option's line changes, so comments and key order
+        are kept. Falls back to dumping the whole config when the line can't
+        be matched exactly once. The file is replaced atomically.
 
-        except Exception as e:
-            raise ConfigurationError(
-                f"Error retrieving script option '{key}': {e}"
-            ) from e
+        Args:
+            key (str): Trading option key with a pattern in TRADING_OPTION_LINE_RES
+            value (float): New value
+        """
+        with open(self.config_file, "rb") as file:
+            data = file.read()
+
+        data, count = TRADING_OPTION_LINE_RES[key].subn(
+            lambda match: match.group(1) + repr(value).encode() + match.group(2),
+            data,
+        )
+        if count != 1:
+            config_data = copy.deepcopy(self.config_data)
+            config_data["trading_options"][key] = value
+            data = yaml.dump(
+                config_data,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+                encoding="utf-8",
+            )
+
+        tmp_path = f"{self.config_file}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, self.config_file)
+        self._invalidate_config_cache()
 
     def set_take_profit(self, new_tp: float):
         """
@@ -422,13 +477,11 @@ class ConfigurationManager:
             ConfigurationError: If update or save fails
         """
         try:
-            # Update in-memory config
             if "trading_options" not in self.config_data:
                 raise ConfigurationError("Missing 'trading_options' in config.")
+            # Write to file, in-memory config only follows a successful write
+            self._write_trading_option("TAKE_PROFIT", float(new_tp))
             self.config_data["trading_options"]["TAKE_PROFIT"] = float(new_tp)
-            # Write to file
-            with open(self.config_file, "w", encoding="utf-8") as file:
-                yaml.safe_dump(self.config_data, file, default_flow_style=False)
         except Exception as e:
             raise ConfigurationError(f"Failed to update TAKE_PROFIT: {e}")
 
@@ -441,12 +494,10 @@ class ConfigurationManager:
             ConfigurationError: If update or save fails
         """
         try:
-            # Update in-memory config
             if "trading_options" not in self.config_data:
                 raise ConfigurationError("Missing 'trading_options' in config.")
+            # Write to file, in-memory config only follows a successful write
+            self._write_trading_option("STOP_LOSS", float(new_sl))
             self.config_data["trading_options"]["STOP_LOSS"] = float(new_sl)
-            # Write to file
-            with open(self.config_file, "w", encoding="utf-8") as file:
-                yaml.safe_dump(self.config_data, file, default_flow_style=False)
         except Exception as e:
             raise ConfigurationError(f"Failed to update STOP_LOSS: {e}")
@@ -0,0 +1,31 @@
+var dagfuncs = window.dashAgGridFunctions = window.dashAgGridFunctions || {};
+
+// d3.format builds a formatter object per call; build each one once, on
+// first use (d3 may not be loaded yet when assets run), and share it
+// between both grids
+var d3Formats = {};
+
+function d3Format(specifier) {
+    return d3Formats[specifier] || (d3Formats[specifier] = d3.format(specifier));
+}
+
+// Cell formatters and class rules referenced by name from dash_aggrid_table.py
+dagfuncs.fmtPercent = function (params) {
+    return d3Format('.2%')(params.value / 100);
+}
+
+dagfuncs.fmtUsd = function (params) {
+    return d3Format('$,.6f')(params.value);
+}
+
+dagfuncs.fmtAmount = function (params) {
+    return d3Format('.6f')(params.value);
+}
+
+dagfuncs.isLoss = function (params) {
+    return params.value <= 0;
+}
+
+dagfuncs.isGain = function (params) {
+    return params.value > 0;
+}
@@ -0,0 +1,8 @@
+// Stop polling the server while the dashboard tab is in the background
+document.addEventListener("visibilitychange", function () {
+    if (window.dash_clientside && window.dash_clientside.set_props) {
+        window.dash_clientside.set_props("interval-component", {
+            disabled: document.hidden
+        });
+    }
+});
@@ -1,32 +1,68 @@
 import dash
+import os
+import copy
+import mmap
+import time
 import json
 import yaml
-import random
 import docker
 import dash_ag_grid as dag
 from dash import dcc, html, ctx, Input, Output, State
 from dash.dash_table import FormatTemplate
 import dash_bootstrap_components as dbc
+import plotly.io as pio
+from flask_compress import Compress
 from types import SimpleNamespace
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from pathlib import Path
 from datetime import datetime
 from dateutil.parser import parse
 from web_layout.utils import money_color
 from web_layout.dash_aggrid_table import *
 from web_layout.modals import (
+    build_coin_options,
     container_status_modal,
     stop_loss_modal,
     set_coin_tp_modal,
     take_profit_modal,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 P_BG_DARK = "p-1 bg-dark"
 USER_DATA_ = "/user_data/"
 
-# Create a Docker client
-client = docker.from_env()
+# Create a low-level Docker API client, configured from the environment
+api = docker.from_env().api
+
+BOT_CONTAINER = "bvt_bot"
+CONTAINER_TTL = 5
+# [status, fetched_at] so repeated clicks skip the daemon round trip
+_container_cache = [None, 0.0]
+
+
+def get_bvt_container_status():
+    now = time.monotonic()
+    if _container_cache[0] is None or now - _container_cache[1] > CONTAINER_TTL:
+        _container_cache[0] = api.inspect_container(BOT_CONTAINER)["State"]["Status"]
+        _container_cache[1] = now
+    return _container_cache[0]
+
+
+def forget_bvt_container():
+    # cached status is stale after stop/start/restart
+    _container_cache[0] = None
+
 
 # Initialize the Dash app
 app = dash.Dash(
@@ -36,21 +72,31 @@ app = dash.Dash(
     suppress_callback_exceptions=True,
 )
 
+# Callback payloads are HTML and JSON text, gzip them on the way out
+app.server.config["COMPRESS_MIMETYPES"] = [
+    "application/json",
+    "application/javascript",
+    "text/html",
+    "text/css",
+]
+app.server.config["COMPRESS_LEVEL"] = 6
+Compress(app.server)
 
-# Define the SQLite database connection function
-def get_db_connection():
-    database = "transactions.db"
-    database_path = f"sqlite:///../../user_data/{database}"
-    engine = create_engine(database_path)
-    try:
-        conn = engine.connect()
-    except Exception as e:
-        print(f"Could not connect to database. Error: {e}")
-        conn = None
-    return conn
+# Dash encodes layout and callback responses (grid rows included) through
+# plotly's serializer, not Flask's JSON provider, so pin that one to orjson
+if orjson:
+    pio.json.config.default_engine = "orjson"
 
 
 user_data_path = str(Path(__file__).parent.parent.parent.as_posix())
+# path to the transactions database
+database_file = user_data_path + USER_DATA_ + "transactions.db"
+
+# One engine for the process, callbacks only check a connection out of its pool
+ENGINE = create_engine(
+    f"sqlite:///{database_file}", connect_args={"check_same_thread": False}
+)
+
 interval = 10000
 # path to bought coins file
 coins_bought_file = user_data_path + USER_DATA_ + "coins_bought.json"
@@ -59,12 +105,277 @@ profile_summary_file = user_data_path + USER_DATA_ + "profile_summary.json"
 # path to config file
 config_file = user_data_path + USER_DATA_ + "config.yml"
 
-with open(config_file) as file:
-    config = yaml.safe_load(file)
+OPEN_TRADES_COLUMNS = (
+    "id",
+    "buy_time",
+    "symbol",
+    "volume",
+    "bought_at",
+    "now_at",
+    "change_perc",
+    "profit_dollars",
+    "time_held",
+    "tp_perc",
+    "sl_perc",
+    "buy_signal",
+)
+
+CLOSED_TRADES_COLUMNS = (
+    "id",
+    "buy_time",
+    "symbol",
+    "volume",
+    "bought_at",
+    "sold_at",
+    "change_perc",
+    "profit_dollars",
+    "sell_time",
+    "time_held",
+    "tp_perc",
+    "sl_perc",
+    "buy_signal",
+    "sell_reason",
+)
+
+# open and closed trades are filtered by sqlite, only the grid columns are read
+OPEN_TRADES_SQL = f"""
+SELECT {", ".join(OPEN_TRADES_COLUMNS)}
+FROM transactions
+WHERE closed = 0
+"""
+
+# closed trades are served a block at a time to the infinite row model
+CLOSED_TRADES_SQL = f"""
+SELECT {", ".join(CLOSED_TRADES_COLUMNS)}
+FROM transactions
+WHERE closed = 1{{where}}
+ORDER BY {{order}}
+LIMIT :limit OFFSET :offset
+"""
+
+CLOSED_TRADES_COUNT_SQL = "SELECT COUNT(*) FROM transactions WHERE closed = 1{where}"
+
+# only grid columns may reach the generated ORDER BY / WHERE
+CLOSED_TRADES_FIELDS = frozenset(
+    column["field"] for column in columnDefs_closed_trades
+) - {"id"}
+
+# time_held is stored as str(timedelta) ("9:00:00.5", "1 day, 2:03:04"), sort
+# by the elapsed days instead of the text
+CLOSED_TRADES_SORT_EXPRS = {
+    "time_held": "julianday(sell_time) - julianday(buy_time)",
+}
+
+# timestamps are stored with microseconds, filter on the displayed seconds
+CLOSED_TRADES_FILTER_EXPRS = {
+    "buy_time": "substr(buy_time, 1, 19)",
+    "sell_time": "substr(sell_time, 1, 19)",
+}
+
+NUMBER_FILTER_OPS = {
+    "equals": "=",
+    "notEqual": "!=",
+    "greaterThan": ">",
+    "greaterThanOrEqual": ">=",
+    "lessThan": "<",
+    "lessThanOrEqual": "<=",
+}
+
+TEXT_FILTER_PATTERNS = {
+    "contains": ("LIKE", "%{}%"),
+    "notContains": ("NOT LIKE", "%{}%"),
+    "equals": ("=", "{}"),
+    "notEqual": ("!=", "{}"),
+    "startsWith": ("LIKE", "{}%"),
+    "endsWith": ("LIKE", "%{}"),
+}
+
+SET_COIN_TP_SQL = text(
+    "UPDATE transactions SET tp_perc = :tp WHERE symbol = :symbol AND closed = 0"
+)
+
+
+def records(df, columns):
+    # one C-level tolist() instead of a Series per row in to_dict("records")
+    return [dict(zip(columns, row)) for row in df.to_numpy().tolist()]
+
+
+def closed_trades_order(sort_model):
+    order = [
+        f"{CLOSED_TRADES_SORT_EXPRS.get(sort['colId'], sort['colId'])} "
+        f"{'ASC' if sort.get('sort') == 'asc' else 'DESC'}"
+        for sort in sort_model
+        if sort.get("colId") in CLOSED_TRADES_FIELDS
+    ]
+    return ", ".join(order) or "sell_time DESC"
+
+
+def filter_condition(column, model, params):
+    if "conditions" in model:
+        parts = [filter_condition(column, m, params) for m in model["conditions"]]
+        parts = [part for part in parts if part]
+        joiner = " OR " if model.get("operator") == "OR" else " AND "
+        return f"({joiner.join(parts)})" if parts else None
+
+    kind = model.get("type")
+    if kind == "blank":
+        return f"{column} IS NULL"
+    if kind == "notBlank":
+        return f"{column} IS NOT NULL"
+
+    name = f"p{len(params)}"
+    if model.get("filterType") == "number":
+        if kind == "inRange":
+            params[name] = model.get("filter")
+            params[name + "_to"] = model.get("filterTo")
+            return f"{column} BETWEEN :{name} AND :{name}_to"
+        if kind not in NUMBER_FILTER_OPS:
+            return None
+        params[name] = model.get("filter")
+        return f"{column} {NUMBER_FILTER_OPS[kind]} :{name}"
+
+    if kind not in TEXT_FILTER_PATTERNS:
+        return None
+    op, pattern = TEXT_FILTER_PATTERNS[kind]
+    params[name] = pattern.format(model.get("filter", ""))
+    return f"{column} {op} :{name}"
+
+
+def closed_trades_where(filter_model):
+    params = {}
+    conditions = [
+        filter_condition(CLOSED_TRADES_FILTER_EXPRS.get(column, column), model, params)
+        for column, model in filter_model.items()
+        if column in CLOSED_TRADES_FIELDS and column not in CLOSED_TRADES_SORT_EXPRS
+    ]
+    where = "".join(f" AND {c}" for c in conditions if c)
+    return where, params
+
+
+def format_trade_times(trades):
+    trades["time_held"] = (
+        pd.to_timedelta(trades["time_held"]).dt.floor(freq="s").astype("string")
+    )
+    trades["buy_time"] = pd.to_datetime(
+        trades["buy_time"], format="ISO8601", cache=True
+    ).dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def format_sell_time(trades):
+    # ISO8601 accepts sell times with and without fractional seconds
+    trades["sell_time"] = pd.to_datetime(
+        trades["sell_time"], format="ISO8601", cache=True
+    ).dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+# parsed files keyed by path -> (st_mtime_ns, value)
+_file_cache = {}
+
+
+def load_cached(path, loader):
+    mtime = os.stat(path).st_mtime_ns
+    entry = _file_cache.get(path)
+    if entry and entry[0] == mtime:
+        return entry[1]
+    value = loader(path)
+    _file_cache[path] = (mtime, value)
+    return value
+
+
+def read_yaml(path):
+    with open(path, "rb") as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
+def read_json(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def read_coins_bought(path):
+    with open(path, "rb") as f:
+        # orjson parses straight from the mapped pages, no bytes copy. Only
+        # for coins_bought.json, whose writers all replace the file instead
+        # of truncating it under the mapping
+        if orjson and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def write_json(path, data):
+    # Swap a complete file in, read_coins_bought may have the old one mapped
+    tmp_path = f"{path}.tmp"
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+    else:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=4)
+    os.replace(tmp_path, path)
+
+
+def read_profile_summary(path):
+    # profile_summary.json is flat, a single namespace covers every key
+    return SimpleNamespace(**read_json(path))
+
+
+def write_config(config):
+    # Swap a complete file in, the bot and the other UIs read it concurrently
+    tmp_path = f"{config_file}.tmp"
+    with open(tmp_path, "w") as file:
+        yaml.dump(config, file, Dumper=SafeDumper, default_flow_style=False)
+    os.replace(tmp_path, config_file)
+    _file_cache.pop(config_file, None)
+
+
+config = load_cached(config_file, read_yaml)
+
+
+def parse_time(value):
+    # the bot writes str(datetime), which fromisoformat reads without dateutil
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parse(value)
+
+
+def file_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def session_version():
+    return [file_mtime(profile_summary_file), file_mtime(config_file)]
+
+
+def trades_version():
+    # sqlite may only touch the -wal file until the next checkpoint
+    return [file_mtime(database_file), file_mtime(database_file + "-wal")]
+
 
 money = FormatTemplate.money(4)
 percentage = FormatTemplate.percentage(2)
 
+# Dashboard text, filled per tick with format_map from profile_summary fields
+SESSION_STARTED_TMPL = "#### Started: {started_at} | Running for: {run_for}"
+SESSION_TRADES_TMPL = "#### Current Trades: {current_holds}/{slots} ({current_exposure}/{invstment_total} {pair_with})"
+REALISED_TMPL = "<h4 class='my-2 p-2 border-{realised_color} border-start border-5'> Realised: <span class='text-center text-{realised_color}'>{realised_session_profit_incfees_perc:.2f}</span>% <p>Est: $<span class='text-center text-{realised_color}'>{realised_session_profit_incfees_total} </span>{pair_with}</p></h4>"
+MARKET_TMPL = "<h4 class='my-2 p-2 border-{market_perf_color} border-start border-5'> Market Performance: <span class='text-center text-{market_perf_color};'>{market_link}% </span> <span> (Since STARTED)</span></h4>"
+UNREALISED_TMPL = '<h4 class="my-2 p-2 border-{unrealised_color} border-start border-5"> Unrealised: <span class="text-{unrealised_color}">{unrealised_session_profit_incfees_perc:.5f}</span>% <p>Est: $<span class="text-{unrealised_color}">{unrealised_session_profit_incfees_total} </span>{pair_with}</p></h4>'
+BUYING_TMPL = '<h4 class="my-2 p-2 border-{color} border-start border-5"><span class="text-{color}">{msg}</span> <span> | Next market check: {next_check_time}</span></h4>'
+TOTAL_TMPL = "<h4 class='my-2 p-2 border-{total_color} border-start border-5'> Total: <span class='text-center text-{total_color}'>{session_profit_incfees_total_perc:.5f}</span>% <p>Est: $<span class='text-{total_color}'>{session_profit_incfees_total}</span> {pair_with}</p></h4>"
+BOT_PERF_TMPL = "<h4 class='bg-secondary my-2 p-2 border-{bot_perf_color} border-start border-5'> Bot Performance: <span class='text-center text-{bot_perf_color}'>{bot_profit_perc_rounded}</span>%<span> Est: $</span><span class='text-{bot_perf_color}'>{bot_profit} </span>{pair_with}</h4>"
+COMPLETED_TMPL = "<h4 class='bg-secondary my-2 p-2 border-start border-5'> Completed Trades: {trades_completed} (Wins: <span class='text-success'>{trade_wins}</span>, Losses: <span class='text-danger'>{trade_losses} </span>) | Win Ratio: {win_ratio}%</h4>"
+STRATEGY_TMPL = "<h4 class='bg-secondary my-2 p-2 border-start border-5'> Strategy: {strategy} SL: {stop_loss}</h4>"
+OPEN_TRADES_TMPL = "<h3 class='fw-bold fst-italic'> Open Trades (Winning: <span class='text-success'>{winning_trades}</span> | Losing: <span class='text-danger'>{losing_trades}</span>)</h3>"
+
 
 def generate_header_row():
     return dbc.Row(
@@ -245,7 +556,7 @@ def generate_trades():
                         id="closed_trades-table",
                         className="ag-theme-balham-dark",
                         columnDefs=columnDefs_closed_trades,
-                        rowData=[],
+                        rowModelType="infinite",
                         columnSize="sizeToFit",
                         defaultColDef=defaultColDef,
                         dashGridOptions=dashGridOption_closed_trades,
@@ -272,6 +583,8 @@ app.layout = dbc.Container(
         dcc.Interval(
             id="interval-component", interval=interval
         ),  # update every x seconds
+        dcc.Store(id="session-version"),
+        dcc.Store(id="trades-version"),
         take_profit_modal,
         stop_loss_modal,
         container_status_modal,
@@ -280,11 +593,8 @@ app.layout = dbc.Container(
 )
 
 
-# Define the callback function that updates the table
+# Session and all-time figures come from profile_summary.json and config.yml
 @app.callback(
-    Output("open_trades-table", "rowData"),
-    Output("closed_trades-table", "rowData"),
-    Output("open_trades_markdown", "children"),
     Output("current_session_col_1", "children"),
     Output("current_session_col_2", "children"),
     Output("current_session_col_3", "children"),
@@ -295,14 +605,15 @@ app.layout = dbc.Container(
     Output("all_time_data_col_1", "children"),
     Output("all_time_data_col_2", "children"),
     Output("all_time_data_col_3", "children"),
+    Output("session-version", "data"),
     Input("interval-component", "n_intervals"),
+    State("session-version", "data"),
 )
-def update(n_intervals):
-    with open(profile_summary_file) as f:
-        profile_summary = json.load(f, object_hook=lambda d: SimpleNamespace(**d))
-
-    with open(config_file) as file:
-        config = yaml.safe_load(file)
+def update_session(n_intervals, last_version):
+    # taken before reading so a write during this tick triggers the next one
+    version = session_version()
+    profile_summary = load_cached(profile_summary_file, read_profile_summary)
+    config = load_cached(config_file, read_yaml)
 
     try:
         started = profile_summary.started
@@ -317,22 +628,6 @@ def update(n_intervals):
         run_for = "NA"
         print(f"Attribute error: {e}")
 
-    realised_color = money_color(profile_summary.realised_session_profit_incfees_perc)
-
-    market_perf_color = (
-        "danger" if profile_summary.all_time_market_profit <= 0 else "success"
-    )
-    market_link = (
-        f'<a style="color: {market_perf_color}; text-decoration: none;" target="_blank" '
-        f'href="https://www.binance.com/en/trade/BTCUSDT">'
-        + str(profile_summary.all_time_market_profit)
-        + "</a>"
-    )
-
-    unrealised_color = money_color(
-        profile_summary.unrealised_session_profit_incfees_perc
-    )
-
     if profile_summary.bot_paused:
         msg = "Buying Paused"
         color = "red"
@@ -341,7 +636,7 @@ def update(n_intervals):
         color = "success"
 
     try:
-        next_check_time = parse(profile_summary.market_next_check_time)
+        next_check_time = parse_time(profile_summary.market_next_check_time)
         if next_check_time > datetime.now():
             next_check_time = profile_summary.market_next_check_time.split(" ")[
                 1
@@ -352,85 +647,67 @@ def update(n_intervals):
         next_check_time = "NA"
         print(f"Error parsing next check time: {e}")
 
-    total_color = money_color(profile_summary.session_profit_incfees_total_perc)
-    bot_perf_color = "danger" if profile_summary.bot_profit_perc < 0 else "success"
+    fields = vars(profile_summary) | {
+        "started_at": started.split(".")[0],
+        "run_for": run_for,
+        "msg": msg,
+        "color": color,
+        "next_check_time": next_check_time,
+    }
+    current_session_col_1 = SESSION_STARTED_TMPL.format_map(fields)
+    current_session_col_7 = BUYING_TMPL.format_map(fields)
+
+    # Running time and next check move on their own, everything else only
+    # changes when the bot writes its files
+    if version == last_version:
+        return (
+            (current_session_col_1,)
+            + (dash.no_update,) * 4
+            + (current_session_col_7,)
+            + (dash.no_update,) * 5
+        )
 
-    # Connect to the database and retrieve the transaction data
-    conn = get_db_connection()
-    df = pd.read_sql_query("select * from transactions order by sell_time desc", conn)
+    realised_color = money_color(profile_summary.realised_session_profit_incfees_perc)
 
-    df["time_held"] = (
-        pd.to_timedelta(df["time_held"]).dt.floor(freq="s").astype("string")
+    market_perf_color = (
+        "danger" if profile_summary.all_time_market_profit <= 0 else "success"
+    )
+    market_link = (
+        f'<a style="color: {market_perf_color}; text-decoration: none;" target="_blank" '
+        f'href="https://www.binance.com/en/trade/BTCUSDT">'
+        + str(profile_summary.all_time_market_profit)
+        + "</a>"
     )
-    df["buy_time"] = pd.to_datetime(df["buy_time"]).dt.strftime("%Y-%m-%d %H:%M:%S")
-    # loop through each value in sell_time column
-    for i in range(len(df)):
-        # check if value already has milliseconds
-        if df.loc[i, "sell_time"] is not None and "." not in df.loc[i, "sell_time"]:
-            # add random milliseconds
-            ms = random.randint(0, 999)
-            df.loc[i, "sell_time"] += f".{ms:03d}"
-
-    # convert to datetime
-    df["sell_time"] = pd.to_datetime(df["sell_time"]).dt.strftime("%Y-%m-%d %H:%M:%S")
-
-    open_trades_columns = [
-        "id",
-        "buy_time",
-        "symbol",
-        "volume",
-        "bought_at",
-        "now_at",
-        "change_perc",
-        "profit_dollars",
-        "time_held",
-        "tp_perc",
-        "sl_perc",
-        "buy_signal",
-    ]
-    open_trades = df.loc[df["closed"] == 0, open_trades_columns]
-    open_trades["id"] = list(range(1, len(open_trades) + 1))
-
-    closed_trades_columns = [
-        "id",
-        "buy_time",
-        "symbol",
-        "volume",
-        "bought_at",
-        "sold_at",
-        "change_perc",
-        "profit_dollars",
-        "sell_time",
-        "time_held",
-        "tp_perc",
-        "sl_perc",
-        "buy_signal",
-        "sell_reason",
-    ]
-    closed_trades = df.loc[df["closed"] == 1, closed_trades_columns]
-    closed_trades["id"] = list(range(1, len(closed_trades) + 1))
-
-    winning_trades = open_trades[open_trades["change_perc"] > 0].shape[0]
-    losing_trades = open_trades[open_trades["change_perc"] <= 0].shape[0]
-    markdown_open_trades = f"<h3 class='fw-bold fst-italic'> Open Trades (Winning: <span class='text-success'>{winning_trades}</span> | Losing: <span class='text-danger'>{losing_trades}</span>)</h3>"
 
-    current_session_col_1 = (
-        f"#### Started: {started.split('.')[0]} | Running for: {run_for}"
+    unrealised_color = money_color(
+        profile_summary.unrealised_session_profit_incfees_perc
     )
-    current_session_col_2 = f"#### Current Trades: {profile_summary.current_holds}/{profile_summary.slots} ({profile_summary.current_exposure}/{profile_summary.invstment_total} {profile_summary.pair_with})"
-    current_session_col_3 = f"<h4 class='my-2 p-2 border-{realised_color} border-start border-5'> Realised: <span class='text-center text-{realised_color}'>{profile_summary.realised_session_profit_incfees_perc:.2f}</span>% <p>Est: $<span class='text-center text-{realised_color}'>{profile_summary.realised_session_profit_incfees_total} </span>{profile_summary.pair_with}</p></h4>"
-    current_session_col_4 = f"<h4 class='my-2 p-2 border-{market_perf_color} border-start border-5'> Market Performance: <span class='text-center text-{market_perf_color};'>{market_link}% </span> <span> (Since STARTED)</span></h4>"
-    current_session_col_6 = f'<h4 class="my-2 p-2 border-{unrealised_color} border-start border-5"> Unrealised: <span class="text-{unrealised_color}">{profile_summary.unrealised_session_profit_incfees_perc:.5f}</span>% <p>Est: $<span class="text-{unrealised_color}">{profile_summary.unrealised_session_profit_incfees_total} </span>{profile_summary.pair_with}</p></h4>'
-    current_session_col_7 = f'<h4 class="my-2 p-2 border-{color} border-start border-5"><span class="text-{color}">{msg}</span> <span> | Next market check: {next_check_time}</span></h4>'
-    current_session_col_9 = f"<h4 class='my-2 p-2 border-{total_color} border-start border-5'> Total: <span class='text-center text-{total_color}'>{profile_summary.session_profit_incfees_total_perc:.5f}</span>% <p>Est: $<span class='text-{total_color}'>{profile_summary.session_profit_incfees_total}</span> {profile_summary.pair_with}</p></h4>"
-    all_time_data_col_1 = f"<h4 class='bg-secondary my-2 p-2 border-{bot_perf_color} border-start border-5'> Bot Performance: <span class='text-center text-{bot_perf_color}'>{round(float(profile_summary.bot_profit_perc), 2)}</span>%<span> Est: $</span><span class='text-{bot_perf_color}'>{profile_summary.bot_profit} </span>{profile_summary.pair_with}</h4>"
-    all_time_data_col_2 = f"<h4 class='bg-secondary my-2 p-2 border-start border-5'> Completed Trades: {profile_summary.trade_wins + profile_summary.trade_losses} (Wins: <span class='text-success'>{profile_summary.trade_wins}</span>, Losses: <span class='text-danger'>{profile_summary.trade_losses} </span>) | Win Ratio: {profile_summary.win_ratio}%</h4>"
-    all_time_data_col_3 = f"<h4 class='bg-secondary my-2 p-2 border-start border-5'> Strategy: {config['trading_options']['SIGNALLING_MODULES'][1]} SL: {config['trading_options']['STOP_LOSS']}</h4>"
+
+    total_color = money_color(profile_summary.session_profit_incfees_total_perc)
+    bot_perf_color = "danger" if profile_summary.bot_profit_perc < 0 else "success"
+
+    fields |= {
+        "realised_color": realised_color,
+        "market_perf_color": market_perf_color,
+        "market_link": market_link,
+        "unrealised_color": unrealised_color,
+        "total_color": total_color,
+        "bot_perf_color": bot_perf_color,
+        "bot_profit_perc_rounded": round(float(profile_summary.bot_profit_perc), 2),
+        "trades_completed": profile_summary.trade_wins + profile_summary.trade_losses,
+        "strategy": config["trading_options"]["SIGNALLING_MODULES"][1],
+        "stop_loss": config["trading_options"]["STOP_LOSS"],
+    }
+    current_session_col_2 = SESSION_TRADES_TMPL.format_map(fields)
+    current_session_col_3 = REALISED_TMPL.format_map(fields)
+    current_session_col_4 = MARKET_TMPL.format_map(fields)
+    current_session_col_6 = UNREALISED_TMPL.format_map(fields)
+    current_session_col_9 = TOTAL_TMPL.format_map(fields)
+    all_time_data_col_1 = BOT_PERF_TMPL.format_map(fields)
+    all_time_data_col_2 = COMPLETED_TMPL.format_map(fields)
+    all_time_data_col_3 = STRATEGY_TMPL.format_map(fields)
 
     return (
-        open_trades.to_dict("records"),
-        closed_trades.to_dict("records"),
-        markdown_open_trades,
         current_session_col_1,
         current_session_col_2,
         current_session_col_3,
@@ -441,8 +718,92 @@ def update(n_intervals):
         all_time_data_col_1,
         all_time_data_col_2,
         all_time_data_col_3,
+        version,
+    )
+
+
+# Open trades come from the transactions database
+@app.callback(
+    Output("open_trades-table", "rowData"),
+    Output("open_trades_markdown", "children"),
+    Output("trades-version", "data"),
+    Input("interval-component", "n_intervals"),
+    State("trades-version", "data"),
+)
+def update_trades(n_intervals, last_version):
+    version = trades_version()
+    if version == last_version:
+        return dash.no_update, dash.no_update, dash.no_update
+
+    # Connect to the database and retrieve the transaction data
+    with ENGINE.connect() as conn:
+        open_trades = pd.read_sql_query(OPEN_TRADES_SQL, conn)
+
+    format_trade_times(open_trades)
+    open_trades["id"] = np.arange(1, len(open_trades) + 1, dtype=np.int32)
+
+    change_perc = open_trades["change_perc"].to_numpy()
+    winning_trades = int((change_perc > 0).sum())
+    losing_trades = int((change_perc <= 0).sum())
+    markdown_open_trades = OPEN_TRADES_TMPL.format_map(
+        {"winning_trades": winning_trades, "losing_trades": losing_trades}
+    )
+
+    return (
+        records(open_trades, OPEN_TRADES_COLUMNS),
+        markdown_open_trades,
+        version,
+    )
+
+
+@app.callback(
+    Output("closed_trades-table", "getRowsResponse"),
+    Input("closed_trades-table", "getRowsRequest"),
+)
+def get_closed_trades_rows(request):
+    if not request:
+        return dash.no_update
+
+    start_row = request["startRow"]
+    where, params = closed_trades_where(request.get("filterModel") or {})
+    order = closed_trades_order(request.get("sortModel") or [])
+    query = text(CLOSED_TRADES_SQL.format(where=where, order=order))
+    count_query = text(CLOSED_TRADES_COUNT_SQL.format(where=where))
+
+    with ENGINE.connect() as conn:
+        closed_trades = pd.read_sql_query(
+            query,
+            conn,
+            params={
+                **params,
+                "limit": request["endRow"] - start_row,
+                "offset": start_row,
+            },
+        )
+        row_count = conn.execute(count_query, params).scalar()
+
+    format_trade_times(closed_trades)
+    format_sell_time(closed_trades)
+    closed_trades["id"] = np.arange(
+        start_row + 1, start_row + len(closed_trades) + 1, dtype=np.int32
     )
 
+    return {"rowData": records(closed_trades, CLOSED_TRADES_COLUMNS), "rowCount": row_count}
+
+
+# New closed trades only show up once the grid drops its cached blocks
+app.clientside_callback(
+    """
+    function(version) {
+        dash_ag_grid.getApiAsync("closed_trades-table").then(
+            (api) => api.refreshInfiniteCache()
+        );
+    }
+    """,
+    Input("trades-version", "data"),
+    prevent_initial_call=True,
+)
+
 
 @app.callback(
     Output("container-status-modal", "is_open"),
@@ -459,29 +820,28 @@ def handle_container_status_actions(
     if not any([stop_clicks, start_clicks, restart_clicks, close_clicks]):
         return is_open, ""
 
-    container_name = "bvt_bot"
     triggered_id = ctx.triggered[0]["prop_id"].split(".")[0]
 
     if triggered_id == "stop-container":
-        container = client.containers.get(container_name)
-        if container.status == "running":
-            container.stop()
+        if get_bvt_container_status() == "running":
+            api.stop(BOT_CONTAINER)
+            forget_bvt_container()
             return not is_open, "Container has been stopped."
         else:
             return is_open, "Container is already stopped."
 
     elif triggered_id == "start-container":
-        container = client.containers.get(container_name)
-        if container.status == "exited":
-            container.start()
+        if get_bvt_container_status() == "exited":
+            api.start(BOT_CONTAINER)
+            forget_bvt_container()
             return not is_open, "Container has been started."
         else:
             return is_open, "Container is already running."
 
     elif triggered_id == "restart-container":
-        container = client.containers.get(container_name)
-        if container.status == "running":
-            container.restart()
+        if get_bvt_container_status() == "running":
+            api.restart(BOT_CONTAINER)
+            forget_bvt_container()
             return not is_open, "Container has been restarted."
         else:
             return is_open, "Container is not running."
@@ -512,16 +872,16 @@ def handle_stop_loss_actions(
         return not is_open, dash.no_update
     elif triggered_id == "save-sl-btn":
         if new_sl_value is not None:
+            # edit a copy, the cached config must only change once it's saved
+            config = copy.deepcopy(load_cached(config_file, read_yaml))
             config["trading_options"]["STOP_LOSS"] = new_sl_value
 
             # Save the updated config back to the config file
-            with open(config_file, "w") as file:
-                yaml.dump(config, file, default_flow_style=False)
+            write_config(config)
 
-            container_name_or_id = "bvt_bot"
-            container = client.containers.get(container_name_or_id)
-            if container.status == "running":
-                container.restart()
+            if get_bvt_container_status() == "running":
+                api.restart(BOT_CONTAINER)
+                forget_bvt_container()
 
         return False, None
     else:
@@ -547,11 +907,12 @@ def handle_tp_actions(change_tp_n_clicks, save_tp_n_clicks, is_open, new_tp_valu
         return not is_open, dash.no_update
     elif triggered_id == "save-tp-btn":
         if new_tp_value is not None:
+            # edit a copy, the cached config must only change once it's saved
+            config = copy.deepcopy(load_cached(config_file, read_yaml))
             config["trading_options"]["TAKE_PROFIT"] = new_tp_value
 
             # Save the updated config back to the config file
-            with open(config_file, "w") as cfg_file:
-                yaml.dump(config, cfg_file, default_flow_style=False)
+            write_config(config)
 
             # # Read the current data from the JSON file
             # with open(coins_bought_file, "r") as json_file:
@@ -565,16 +926,25 @@ def handle_tp_actions(change_tp_n_clicks, save_tp_n_clicks, is_open, new_tp_valu
             # with open(coins_bought_file, "w") as json_file:
             #     json.dump(coins_data, json_file, indent=4)
 
-            container_name_or_id = "bvt_bot"
-            container = client.containers.get(container_name_or_id)
-            if container.status == "running":
-                container.restart()
+            if get_bvt_container_status() == "running":
+                api.restart(BOT_CONTAINER)
+                forget_bvt_container()
 
         return False, None
     else:
         return is_open, dash.no_update
 
 
+@app.callback(
+    Output("set-coin-input", "options"),
+    Input("set-coin-tp-modal", "is_open"),
+)
+def load_coin_options(is_open):
+    if not is_open:
+        return dash.no_update
+    return build_coin_options(load_cached(coins_bought_file, read_coins_bought))
+
+
 # Set a specific coin Take Profit callback
 @app.callback(
     Output("set-coin-tp-modal", "is_open"),
@@ -597,25 +967,20 @@ def handle_set_tp_coin(set_coin_tp_n_clicks, save_tp_n_clicks, is_open, coin, tp
     elif triggered_id == "save-coin-tp-btn":
         if coin and tp is not None:
             # Read the current data from the JSON file
-            with open(coins_bought_file, "r") as json_file:
-                coins_data = json.load(json_file)
+            coins_data = read_coins_bought(coins_bought_file)
             # Update the take_profit value for the specific coin in the coins_bought_file
             if coin in coins_data:
                 coins_data[coin]["take_profit"] = int(tp)
                 # Write the updated data back to the JSON file
                 try:
-                    with open(coins_bought_file, "w") as json_file:
-                        json.dump(coins_data, json_file, indent=4)
+                    write_json(coins_bought_file, coins_data)
                 except Exception as e:
                     print("Error while writing JSON:", e)
 
             # Update the take_profit value for the specific coin in db
-            conn = get_db_connection()
             try:
-                query = f"UPDATE transactions SET tp_perc = {float(tp)} WHERE symbol = '{coin}' AND closed = 0"
-                conn.exec_driver_sql(query)
-                conn.commit()
-                conn.close()
+                with ENGINE.begin() as conn:
+                    conn.execute(SET_COIN_TP_SQL, {"tp": float(tp), "symbol": coin})
             except Exception as e:
                 print("Error while updating database:", e)
 
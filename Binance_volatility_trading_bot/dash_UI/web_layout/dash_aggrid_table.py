@@ -1,5 +1,6 @@
-FORMAT___PARAMS_VALUE_ = "d3.format('.2%')(params.value/100)"
-PARAMS_VALUE_ = "d3.format('$,.6f')(params.value)"
+# named functions from assets/dashAgGridFunctions.js
+FORMAT___PARAMS_VALUE_ = "fmtPercent(params)"
+PARAMS_VALUE_ = "fmtUsd(params)"
 cellsytle_jscode = """
 function(params) {
     if (params.value <= 0) {
@@ -15,89 +16,103 @@ function(params) {
 """
 
 
-columnDefs = [
-    {
-        "headerName": "Id",
-        "field": "id",
-        "width": 50,
-        "filter": False,
-    },
-    {
-        "headerName": "Buy Time",
-        "field": "buy_time",
-        "type": "dateColumn",
-        "minWidth": 150,
-    },
-    {
-        "headerName": "Symbol",
-        "field": "symbol",
-        "cellRenderer": "coin_page_link",
-    },
-    {
-        "headerName": "Amount",
-        "field": "volume",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": "d3.format('.6f')(params.value)"},
-        "cellRenderer": "agAnimateShowChangeCellRenderer",
-    },
-    {
-        "headerName": "Bought At",
-        "field": "bought_at",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": PARAMS_VALUE_},
-        "cellRenderer": "agAnimateShowChangeCellRenderer",
+NUMERIC_COLUMN = ["numericColumn", "numberColumnFilter", "customNumericFormat"]
+
+# Column definitions shared by the open and closed trades grids
+ID_COL = {
+    "headerName": "Id",
+    "field": "id",
+    "width": 50,
+    "filter": False,
+}
+BUY_TIME_COL = {
+    "headerName": "Buy Time",
+    "field": "buy_time",
+    "type": "dateColumn",
+    "minWidth": 150,
+}
+SYMBOL_COL = {
+    "headerName": "Symbol",
+    "field": "symbol",
+    "cellRenderer": "coin_page_link",
+}
+AMOUNT_COL = {
+    "headerName": "Amount",
+    "field": "volume",
+    "type": NUMERIC_COLUMN,
+    "valueFormatter": {"function": "fmtAmount(params)"},
+    "cellRenderer": "agAnimateShowChangeCellRenderer",
+}
+BOUGHT_AT_COL = {
+    "headerName": "Bought At",
+    "field": "bought_at",
+    "type": NUMERIC_COLUMN,
+    "valueFormatter": {"function": PARAMS_VALUE_},
+    "cellRenderer": "agAnimateShowChangeCellRenderer",
+}
+CHANGE_PERC_COL = {
+    "headerName": "Change %",
+    "field": "change_perc",
+    "type": NUMERIC_COLUMN,
+    "valueFormatter": {"function": FORMAT___PARAMS_VALUE_},
+    "maxWidth": 200,
+    "cellClassRules": {
+        # apply background color danger to <=0
+        "bg-danger": "isLoss(params)",
+        # apply background color success  to >0
+        "bg-success text-dark": "isGain(params)",
     },
+}
+PROFIT_COL = {
+    "headerName": "Profit $",
+    "field": "profit_dollars",
+    "type": NUMERIC_COLUMN,
+    "valueFormatter": {"function": PARAMS_VALUE_},
+    "aggFunc": "sum",
+    "cellRenderer": "agAnimateShowChangeCellRenderer",
+}
+TP_COL = {
+    "headerName": "TP %",
+    "field": "tp_perc",
+    "type": NUMERIC_COLUMN,
+    "valueFormatter": {"function": FORMAT___PARAMS_VALUE_},
+    "cellRenderer": "agAnimateShowChangeCellRenderer",
+}
+SL_COL = {
+    "headerName": "SL %",
+    "field": "sl_perc",
+    "type": NUMERIC_COLUMN,
+    "valueFormatter": {"function": FORMAT___PARAMS_VALUE_},
+    "cellRenderer": "agAnimateShowChangeCellRenderer",
+}
+TIME_HELD_COL = {
+    "headerName": "Time held",
+    "field": "time_held",
+}
+BUY_SIGNAL_COL = {
+    "headerName": "Buy Signal",
+    "field": "buy_signal",
+}
+
+columnDefs = [
+    ID_COL,
+    BUY_TIME_COL,
+    SYMBOL_COL,
+    AMOUNT_COL,
+    BOUGHT_AT_COL,
     {
         "headerName": "Now At",
         "field": "now_at",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
+        "type": NUMERIC_COLUMN,
         "valueFormatter": {"function": PARAMS_VALUE_},
         "cellRenderer": "agAnimateShowChangeCellRenderer",
     },
-    {
-        "headerName": "Change %",
-        "field": "change_perc",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": FORMAT___PARAMS_VALUE_},
-        "maxWidth": 200,
-        "cellClassRules": {
-            # apply background color danger to <=0
-            "bg-danger": "params.value <= 0",
-            # apply background color success  to >0
-            "bg-success text-dark": "params.value > 0",
-        }
-        # "valueFormatter": "value.toPrecision(3)",
-    },
-    {
-        "headerName": "Profit $",
-        "field": "profit_dollars",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": PARAMS_VALUE_},
-        "aggFunc": "sum",
-        "cellRenderer": "agAnimateShowChangeCellRenderer",
-    },
-    {
-        "headerName": "TP %",
-        "field": "tp_perc",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": FORMAT___PARAMS_VALUE_},
-        "cellRenderer": "agAnimateShowChangeCellRenderer",
-    },
-    {
-        "headerName": "SL %",
-        "field": "sl_perc",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": FORMAT___PARAMS_VALUE_},
-        "cellRenderer": "agAnimateShowChangeCellRenderer",
-    },
-    {
-        "headerName": "Time held",
-        "field": "time_held",
-    },
-    {
-        "headerName": "Buy Signal",
-        "field": "buy_signal",
-    },
+    CHANGE_PERC_COL,
+    PROFIT_COL,
+    TP_COL,
+    SL_COL,
+    TIME_HELD_COL,
+    BUY_SIGNAL_COL,
 ]
 
 defaultColDef = {
@@ -122,96 +137,38 @@ dashGridOption_closed_trades = {
     "headerHeight": 30,
     "pagination": True,
     "paginationPageSize": 10,
+    # infinite row model tuning, blocks are served by get_closed_trades_rows
+    "cacheBlockSize": 100,
+    "maxBlocksInCache": 10,
+    "rowBuffer": 20,
+    "maxConcurrentDatasourceRequests": 2,
 }
 
 columnDefs_closed_trades = [
-    {
-        "headerName": "Id",
-        "field": "id",
-        "width": 50,
-        "filter": False,
-    },
-    {
-        "headerName": "Buy Time",
-        "field": "buy_time",
-        "type": "dateColumn",
-        "minWidth": 150,
-    },
-    {
-        "headerName": "Symbol",
-        "field": "symbol",
-        "cellRenderer": "coin_page_link",
-    },
-    {
-        "headerName": "Amount",
-        "field": "volume",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": "d3.format('.6f')(params.value)"},
-        "cellRenderer": "agAnimateShowChangeCellRenderer",
-    },
-    {
-        "headerName": "Bought At",
-        "field": "bought_at",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": PARAMS_VALUE_},
-        "cellRenderer": "agAnimateShowChangeCellRenderer",
-    },
+    ID_COL,
+    BUY_TIME_COL,
+    SYMBOL_COL,
+    AMOUNT_COL,
+    BOUGHT_AT_COL,
     {
         "headerName": "Sold At",
         "field": "sold_at",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": PARAMS_VALUE_},
-        "cellRenderer": "agAnimateShowChangeCellRenderer",
-    },
-    {
-        "headerName": "Change %",
-        "field": "change_perc",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": FORMAT___PARAMS_VALUE_},
-        "maxWidth": 200,
-        "cellClassRules": {
-            # apply background color danger to <=0
-            "bg-danger": "params.value <= 0",
-            # apply background color success  to >0
-            "bg-success text-dark": "params.value > 0",
-        }
-        # "valueFormatter": "value.toPrecision(3)",
-    },
-    {
-        "headerName": "Profit $",
-        "field": "profit_dollars",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
+        "type": NUMERIC_COLUMN,
         "valueFormatter": {"function": PARAMS_VALUE_},
-        "aggFunc": "sum",
-        "cellRenderer": "agAnimateShowChangeCellRenderer",
-    },
-    {
-        "headerName": "TP %",
-        "field": "tp_perc",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": FORMAT___PARAMS_VALUE_},
-        "cellRenderer": "agAnimateShowChangeCellRenderer",
-    },
-    {
-        "headerName": "SL %",
-        "field": "sl_perc",
-        "type": ["numericColumn", "numberColumnFilter", "customNumericFormat"],
-        "valueFormatter": {"function": "d3.format('.2%')(params.value/100)"},
         "cellRenderer": "agAnimateShowChangeCellRenderer",
     },
+    CHANGE_PERC_COL,
+    PROFIT_COL,
+    TP_COL,
+    SL_COL,
     {
         "headerName": "Sell Time",
         "field": "sell_time",
         "type": "dateColumn",
     },
-    {
-        "headerName": "Time held",
-        "field": "time_held",
-    },
-    {
-        "headerName": "Buy Signal",
-        "field": "buy_signal",
-    },
+    # filtered server side, the stored str(timedelta) doesn't match the display
+    {**TIME_HELD_COL, "filter": False},
+    BUY_SIGNAL_COL,
     {
         "headerName": "Sell Reason",
         "field": "sell_reason",
@@ -1,22 +1,40 @@
-import json
+import sys
 
 import dash_bootstrap_components as dbc
 import yaml
 from dash import dcc, html
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 user_data_path = str(Path(__file__).parent.parent.parent.parent.as_posix())
 config_file = user_data_path + "/user_data/" + "config.yml"
-# path to bought coins file
-coins_bought_file = user_data_path + "/user_data/" + "coins_bought.json"
 
-with open(config_file) as file:
-    config = yaml.safe_load(file)
+# the bot's sources are two levels up in a checkout, share its config cache
+BOT_PATH = str(Path(__file__).resolve().parents[2])
+if BOT_PATH not in sys.path:
+    sys.path.append(BOT_PATH)
+
+try:
+    from helpers.config_cache import load_yaml_cached
+except ImportError:
+    # dash image without the bot sources, parse config.yml directly
+    load_yaml_cached = None
+
+
+def read_yaml(path):
+    with open(path, "rb") as file:
+        return yaml.load(file, Loader=SafeLoader)
 
-# Read the coins data from the JSON file
-with open(coins_bought_file, "r") as json_file:
-    coins_data = json.load(json_file)
-    coin_options = [
+
+config = load_yaml_cached(config_file) if load_yaml_cached else read_yaml(config_file)
+
+
+def build_coin_options(coins_data):
+    return [
         {
             "label": html.Span(
                 [coin],
@@ -27,6 +45,7 @@ with open(coins_bought_file, "r") as json_file:
         for coin in coins_data.keys()
     ]
 
+
 set_coin_tp_modal = dbc.Modal(
     [
         dbc.ModalHeader("Set coin Take Profit"),
@@ -35,7 +54,7 @@ set_coin_tp_modal = dbc.Modal(
                 dcc.Dropdown(
                     id="set-coin-input",
                     className="text-white",
-                    options=coin_options,  # Use the list of coin options
+                    options=[],  # filled from coins_bought.json when the modal opens
                     placeholder="Select a coin",
                     style={"marginRight": "10px", "backgroundColor": "black"},
                 ),
@@ -1,8 +1,13 @@
 # data_provider.py
+import json
+import re
+import time
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterable, List, Optional
+import numpy as np
 from loguru import logger
 from binance.client import Client
+from binance.exceptions import BinanceAPIException
 from external_signal_manager import ExternalSignalManager
 
 
@@ -26,6 +31,23 @@ class DataProvider:
         self.historical_prices = []
         self.hsp_head = -1
 
+        # Same history as a (slot, symbol) price matrix for volatility checks
+        self._price_ring = np.empty((0, 0))
+        self._symbol_index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._last_keys = ()
+        self._last_columns = np.empty(0, dtype=np.intp)
+
+        # Filled slot count and per-slot batch time, kept by _add_to_historical
+        self._filled_count = 0
+        self._slot_times: List[Optional[datetime]] = []
+
+        # Last full price fetch, reused by get_price() within PRICE_CACHE_TTL_MS
+        self.PRICE_CACHE_TTL = config.get("PRICE_CACHE_TTL_MS", 500) / 1000
+        self._prices = None
+        self._prices_ts = 0.0
+        self._prices_in_history = False
+
         # Configuration parameters
         self.TIME_DIFFERENCE = config.get("TIME_DIFFERENCE", 1)
         self.RECHECK_INTERVAL = config.get("RECHECK_INTERVAL", 4)
@@ -39,8 +61,16 @@ class DataProvider:
 
         # Load custom tickers if enabled
         self.tickers = []
+        self._custom_symbols = None
         if self.CUSTOM_LIST and self.TICKERS_LIST:
             self._load_custom_tickers()
+            if self.tickers:
+                self._custom_symbols = [
+                    f"{ticker}{self.PAIR_WITH}" for ticker in self.tickers
+                ]
+
+        # Config never changes after this point, pick the symbol filter once
+        self._include_symbol = self._build_symbol_filter()
         logger.info(
             f"📊 Data provider initialized - Custom list: {'✅' if self.CUSTOM_LIST else '❌'}"
         )
@@ -58,13 +88,24 @@ class DataProvider:
         Creates empty historical data structure based on configuration parameters.
         """
         try:
-            # Calculate required storage size
-            storage_size = self.TIME_DIFFERENCE * self.RECHECK_INTERVAL
+            # Calculate required storage size. The bot used to record two
+            # snapshots per cycle and now records one, so half the slots keep
+            # the CHANGE_IN_PRICE window spanning the same number of cycles
+            storage_size = max(2, (self.TIME_DIFFERENCE * self.RECHECK_INTERVAL + 1) // 2)
 
             # Initialize historical prices array with None values
             self.historical_prices = [None] * storage_size
             self.hsp_head = -1
 
+            self._price_ring = np.full((storage_size, 0), np.nan)
+            self._symbol_index = {}
+            self._symbols = []
+            self._last_keys = ()
+            self._last_columns = np.empty(0, dtype=np.intp)
+
+            self._filled_count = 0
+            self._slot_times = [None] * storage_size
+
             logger.info(
                 f"📈 Historical data initialized - Storage size: {storage_size}"
             )
@@ -90,21 +131,43 @@ class DataProvider:
             logger.error(f"💥 Failed to load custom tickers: {e}")
             self.tickers = []
 
-    def get_price(self, add_to_historical: bool = True) -> Dict[str, Dict[str, Any]]:
+    def get_price(
+        self,
+        add_to_historical: bool = True,
+        symbols: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Get current prices for all relevant trading pairs.
 
+        A default fetch is reused for PRICE_CACHE_TTL_MS, so callers close
+        together in time share one request.
+
         Args:
             add_to_historical: Whether to add prices to historical data
+            symbols: Only fetch these pairs; defaults to the custom ticker
+                list when CUSTOM_LIST is enabled, otherwise all pairs
 
         Returns:
             Dict containing price data for filtered symbols
         """
         try:
+            use_cache = symbols is None
+            if (
+                use_cache
+                and self._prices is not None
+                and time.monotonic() - self._prices_ts < self.PRICE_CACHE_TTL
+            ):
+                logger.debug("📊 Reusing prices fetched moments ago")
+                if add_to_historical and not self._prices_in_history:
+                    self._add_to_historical(self._prices)
+                    self._prices_in_history = True
+                return self._prices
+
             logger.debug("📊 Fetching current prices from Binance...")
 
-            # Get all ticker prices from Binance
-            all_prices = self.client.get_all_tickers()
+            if use_cache:
+                symbols = self._custom_symbols
+            all_prices = self._fetch_tickers(symbols)
 
             # Filter and process prices
             filtered_prices = self._filter_prices(all_prices)
@@ -113,13 +176,62 @@ class DataProvider:
             if add_to_historical:
                 self._add_to_historical(filtered_prices)
 
-            logger.debug(f"📊 Retrieved prices for {len(filtered_prices)} symbols")
+            if use_cache:
+                self._prices = filtered_prices
+                self._prices_ts = time.monotonic()
+                self._prices_in_history = add_to_historical
+
+            logger.debug("📊 Retrieved prices for {} symbols", len(filtered_prices))
             return filtered_prices
 
         except Exception as e:
             logger.error(f"💥 Failed to get prices: {e}")
             raise
 
+    def record_prices(self, prices: Dict[str, Dict[str, Any]]):
+        """
+        Append a snapshot fetched with ``add_to_historical=False`` to the
+        historical data.
+
+        Args:
+            prices: Price data returned by get_price()
+        """
+        self._add_to_historical(prices)
+        if prices is self._prices:
+            self._prices_in_history = True
+
+    def invalidate_price_cache(self):
+        """Force the next get_price() call to hit the API."""
+        self._prices = None
+
+    def _fetch_tickers(self, symbols: Optional[Iterable[str]]) -> List[Dict]:
+        """
+        Fetch ticker prices in a single request.
+
+        Args:
+            symbols: Pairs to request via the ``symbols`` parameter, or None
+                for every pair
+
+        Returns:
+            List of ``{"symbol", "price"}`` tickers
+        """
+        if symbols:
+            try:
+                return self.client.get_symbol_ticker(
+                    symbols=json.dumps(list(symbols), separators=(",", ":"))
+                )
+            except BinanceAPIException as e:
+                # An unknown pair rejects the whole batch, stop batching the
+                # custom list so every cycle doesn't pay for two requests
+                logger.warning(
+                    f"⚠️ Batched ticker request failed, fetching all tickers: {e}"
+                )
+                if symbols is self._custom_symbols:
+                    self._custom_symbols = None
+
+        # Get all ticker prices from Binance
+        return self.client.get_all_tickers()
+
     def _filter_prices(self, all_prices: List[Dict]) -> Dict[str, Dict[str, Any]]:
         """
         Filter prices based on configuration (custom list or pair filtering).
@@ -130,41 +242,54 @@ class DataProvider:
         Returns:
             Dict of filtered prices
         """
-        filtered_prices = {}
-
-        for ticker in all_prices:
-            symbol = ticker["symbol"]
-
-            # Apply filtering logic
-            if self._should_include_symbol(symbol):
-                filtered_prices[symbol] = {
-                    "price": float(ticker["price"]),
-                    "time": datetime.now(),
-                }
-
-        return filtered_prices
+        # One timestamp for the whole batch, the tickers arrived together
+        now = datetime.now()
+        include = self._include_symbol
+        return {
+            ticker["symbol"]: {"price": float(ticker["price"]), "time": now}
+            for ticker in all_prices
+            if include(ticker["symbol"])
+        }
 
-    def _should_include_symbol(self, symbol: str) -> bool:
+    def _build_symbol_filter(self) -> Callable[[str], bool]:
         """
-        Check if symbol should be included based on configuration.
+        Build the predicate deciding if a symbol should be included.
 
-        Args:
-            symbol: Trading pair symbol
+        The custom list / pair filtering choice and the fiat exclusions are
+        resolved here, so the returned function only does the checks that
+        apply to this configuration.
 
         Returns:
-            bool: True if symbol should be included
+            Callable[[str], bool]: True if symbol should be included
         """
-        # Check if symbol contains any excluded fiat pairs
-        if any(fiat in symbol for fiat in self.FIATS):
-            return False
+        pair_with = self.PAIR_WITH
+        # Excluded fiat pairs, matched in one pass
+        fiat_re = (
+            re.compile("|".join(re.escape(fiat) for fiat in self.FIATS))
+            if self.FIATS
+            else None
+        )
 
         if self.CUSTOM_LIST:
             # Use custom ticker list
-            base_symbol = symbol.replace(self.PAIR_WITH, "")
-            return base_symbol in self.tickers
+            tickers = frozenset(self.tickers)
+            suffix_len = len(pair_with)
+
+            def include(symbol: str) -> bool:
+                return (
+                    symbol.endswith(pair_with)
+                    and symbol[:-suffix_len] in tickers
+                    and not (fiat_re and fiat_re.search(symbol))
+                )
+
         else:
             # Use pair filtering
-            return self.PAIR_WITH in symbol
+            def include(symbol: str) -> bool:
+                return pair_with in symbol and not (
+                    fiat_re and fiat_re.search(symbol)
+                )
+
+        return include
 
     def _add_to_historical(self, prices: Dict[str, Dict[str, Any]]):
         """
@@ -175,20 +300,66 @@ class DataProvider:
         """
         try:
             # Move to next position in circular buffer
-            self.hsp_head += 1
-            if self.hsp_head >= len(self.historical_prices):
-                self.hsp_head = 0
+            self.hsp_head = (self.hsp_head + 1) % len(self.historical_prices)
 
             # Store prices at current position
+            if self.historical_prices[self.hsp_head] is None:
+                self._filled_count += 1
             self.historical_prices[self.hsp_head] = prices
+            self._slot_times[self.hsp_head] = (
+                next(iter(prices.values()))["time"] if prices else None
+            )
+
+            columns = self._columns_for(prices)
+            row = self._price_ring[self.hsp_head]
+            row.fill(np.nan)
+            row[columns] = np.fromiter(
+                (data["price"] for data in prices.values()),
+                dtype=np.float64,
+                count=len(prices),
+            )
 
             logger.debug(
-                f"📈 Added prices to historical data at position {self.hsp_head}"
+                "📈 Added prices to historical data at position {}", self.hsp_head
             )
 
         except Exception as e:
             logger.error(f"💥 Failed to add to historical data: {e}")
 
+    def _columns_for(self, prices: Dict[str, Dict[str, Any]]) -> np.ndarray:
+        """
+        Map the symbols of a price snapshot to price ring columns.
+
+        New symbols get a column, the ring grows when it runs out of them.
+
+        Args:
+            prices: Price data keyed by symbol
+
+        Returns:
+            np.ndarray: Column index for each symbol, in the snapshot's order
+        """
+        keys = tuple(prices)
+        if keys == self._last_keys:
+            return self._last_columns
+
+        index = self._symbol_index
+        for symbol in keys:
+            if symbol not in index:
+                index[symbol] = len(self._symbols)
+                self._symbols.append(symbol)
+
+        capacity = self._price_ring.shape[1]
+        if len(self._symbols) > capacity:
+            grow = max(len(self._symbols), 2 * capacity) - capacity
+            padding = np.full((self._price_ring.shape[0], grow), np.nan)
+            self._price_ring = np.hstack((self._price_ring, padding))
+
+        self._last_keys = keys
+        self._last_columns = np.fromiter(
+            (index[symbol] for symbol in keys), dtype=np.intp, count=len(keys)
+        )
+        return self._last_columns
+
     def get_trading_signals(self) -> Dict[str, Dict[str, Any]]:
         """Get trading signals including external signals."""
         try:
@@ -220,14 +391,16 @@ class DataProvider:
 
     def _has_sufficient_data(self) -> bool:
         """Check if we have sufficient historical data."""
-        non_none_count = sum(1 for price in self.historical_prices if price is not None)
         required_count = min(self.TIME_DIFFERENCE * self.RECHECK_INTERVAL, 2)
-        return non_none_count >= required_count
+        return self._filled_count >= required_count
 
     def _detect_volatility(self) -> Dict[str, Dict[str, Any]]:
         """
         Detect volatile coins based on price movement.
 
+        The min/max spread of every symbol in the latest snapshot is
+        computed over the whole price ring at once.
+
         Returns:
             Dict of volatile coins with their signals
         """
@@ -238,74 +411,37 @@ class DataProvider:
             if not current_prices:
                 return volatile_coins
 
-            for symbol in current_prices:
-                try:
-                    # Calculate price change over time period
-                    price_change = self._calculate_price_change(symbol)
-
-                    # Check if change exceeds threshold
-                    change_threshold = self.config.get("CHANGE_IN_PRICE", 3)
-                    if abs(price_change) > change_threshold:
-                        volatile_coins[symbol] = {
-                            "buy_signal": (
-                                "volatility_gain"
-                                if price_change > 0
-                                else "volatility_drop"
-                            ),
-                            "value": 1,
-                            "gain": round(price_change, 3),
-                        }
-
-                        logger.info(
-                            f"🎯 Volatility detected: {symbol} +{price_change:.3f}%"
-                        )
-
-                except Exception as e:
-                    logger.debug(f"⚠️ Error analyzing {symbol}: {e}")
-                    continue
+            # _add_to_historical() last mapped the snapshot at hsp_head
+            columns = self._last_columns
+            window = self._price_ring[:, columns]
+            counts = np.count_nonzero(~np.isnan(window), axis=0)
+            min_prices = np.nanmin(window, axis=0)
+            max_prices = np.nanmax(window, axis=0)
+
+            # Percentage change, 0 with fewer than two samples or no min price
+            with np.errstate(divide="ignore", invalid="ignore"):
+                price_changes = (max_prices - min_prices) / min_prices * 100
+            price_changes[(counts < 2) | ~np.isfinite(price_changes)] = 0
+
+            change_threshold = self.config.get("CHANGE_IN_PRICE", 3)
+            for i in np.flatnonzero(np.abs(price_changes) > change_threshold):
+                symbol = self._symbols[columns[i]]
+                price_change = float(price_changes[i])
+                volatile_coins[symbol] = {
+                    "buy_signal": (
+                        "volatility_gain" if price_change > 0 else "volatility_drop"
+                    ),
+                    "value": 1,
+                    "gain": round(price_change, 3),
+                }
+
+                logger.info(f"🎯 Volatility detected: {symbol} +{price_change:.3f}%")
 
         except Exception as e:
             logger.error(f"💥 Error in volatility detection: {e}")
 
         return volatile_coins
 
-    def _calculate_price_change(self, symbol: str) -> float:
-        """
-        Calculate percentage price change for a symbol over the time period.
-
-        Args:
-            symbol: Trading pair symbol
-
-        Returns:
-            float: Percentage price change
-        """
-        try:
-            # Find min and max prices over the historical period
-            prices = []
-            times = []
-
-            for price_data in self.historical_prices:
-                if price_data and symbol in price_data:
-                    prices.append(float(price_data[symbol]["price"]))
-                    times.append(price_data[symbol]["time"])
-
-            if len(prices) < 2:
-                return 0.0
-
-            min_price = min(prices)
-            max_price = max(prices)
-
-            # Calculate percentage change
-            if min_price > 0:
-                percentage_change = ((max_price - min_price) / min_price) * 100
-                return percentage_change
-
-            return 0.0
-
-        except Exception as e:
-            logger.debug(f"⚠️ Error calculating price change for {symbol}: {e}")
-            return 0.0
-
     def get_historical_data_status(self) -> Dict[str, Any]:
         """
         Get status information about historical data.
@@ -313,11 +449,9 @@ class DataProvider:
         Returns:
             Dict with historical data status
         """
-        non_none_count = sum(1 for price in self.historical_prices if price is not None)
-
         return {
             "total_slots": len(self.historical_prices),
-            "filled_slots": non_none_count,
+            "filled_slots": self._filled_count,
             "current_position": self.hsp_head,
             "data_ready": self._has_sufficient_data(),
             "oldest_data": self._get_oldest_data_time(),
@@ -326,37 +460,37 @@ class DataProvider:
 
     def _get_oldest_data_time(self) -> Optional[str]:
         """Get timestamp of oldest data."""
-        for price_data in self.historical_prices:
-            if price_data:
-                # Get first symbol's time
-                first_symbol = next(iter(price_data))
-                return price_data[first_symbol]["time"].strftime("%Y-%m-%d %H:%M:%S")
-        return None
+        if self.hsp_head < 0:
+            return None
+        # Until the ring wraps the oldest slot is the first one
+        oldest = 0
+        if self._filled_count == len(self._slot_times):
+            oldest = (self.hsp_head + 1) % len(self._slot_times)
+        return self._format_slot_time(oldest)
 
     def _get_newest_data_time(self) -> Optional[str]:
         """Get timestamp of newest data."""
-        if self.hsp_head >= 0 and self.historical_prices[self.hsp_head]:
-            price_data = self.historical_prices[self.hsp_head]
-            first_symbol = next(iter(price_data))
-            return price_data[first_symbol]["time"].strftime("%Y-%m-%d %H:%M:%S")
+        if self.hsp_head >= 0:
+            return self._format_slot_time(self.hsp_head)
         return None
 
+    def _format_slot_time(self, slot: int) -> Optional[str]:
+        slot_time = self._slot_times[slot]
+        return slot_time.strftime("%Y-%m-%d %H:%M:%S") if slot_time else None
+
     def get_symbol_price(self, symbol: str) -> float:
         """Get single symbol price from cached data."""
         try:
             if self.hsp_head >= 0 and self.historical_prices[self.hsp_head]:
                 latest_prices = self.historical_prices[self.hsp_head]
                 if symbol in latest_prices:
-                    return float(latest_prices[symbol]["price"])
+                    return latest_prices[symbol]["price"]
 
-            # Fallback - update cache if empty
+            # Fallback - ask for just this pair while history is still empty
             if not self._has_sufficient_data():
-                logger.debug(f"📊 Updating price cache for {symbol}")
-                self.get_price()
-                if self.hsp_head >= 0 and self.historical_prices[self.hsp_head]:
-                    latest_prices = self.historical_prices[self.hsp_head]
-                    if symbol in latest_prices:
-                        return float(latest_prices[symbol]["price"])
+                logger.debug("📊 Fetching price for {}", symbol)
+                ticker = self.client.get_symbol_ticker(symbol=symbol)
+                return float(ticker["price"])
 
             logger.warning(f"⚠️ Price not found for {symbol}")
             return 0.0
@@ -370,15 +504,12 @@ class DataProvider:
             if self.hsp_head >= 0 and self.historical_prices[self.hsp_head]:
                 latest_prices = self.historical_prices[self.hsp_head]
                 return {
-                    symbol: float(data["price"])
-                    for symbol, data in latest_prices.items()
+                    symbol: data["price"] for symbol, data in latest_prices.items()
                 }
             else:
 
                 price_data = self.get_price()
-                return {
-                    symbol: float(data["price"]) for symbol, data in price_data.items()
-                }
+                return {symbol: data["price"] for symbol, data in price_data.items()}
         except Exception as e:
             logger.error(f"💥 Error getting current prices: {e}")
             return {}
@@ -396,24 +527,24 @@ class DataProvider:
                 return []
 
             # Extract all symbols from the delist schedule
-            delisted_coins = []
-            for entry in delist_schedule:
-                if (
-                    isinstance(entry, dict)
-                    and "symbols" in entry
-                    and isinstance(entry["symbols"], list)
-                ):
-                    delisted_coins.extend(entry["symbols"])
+            symbol_lists = (
+                entry.get("symbols") for entry in delist_schedule if isinstance(entry, dict)
+            )
+            delisted_coins = [
+                coin
+                for symbols in symbol_lists
+                if isinstance(symbols, list)
+                for coin in symbols
+            ]
 
             # Remove duplicates while preserving order
-            seen = set()
-            unique_coins = [
-                coin for coin in delisted_coins if not (coin in seen or seen.add(coin))
-            ]
+            unique_coins = list(dict.fromkeys(delisted_coins))
 
             if unique_coins:
-                logger.debug(
-                    f"Found {len(unique_coins)} coins scheduled for delisting: {', '.join(unique_coins)}"
+                logger.opt(lazy=True).debug(
+                    "Found {} coins scheduled for delisting: {}",
+                    lambda: len(unique_coins),
+                    lambda: ", ".join(unique_coins),
                 )
             return unique_coins
 
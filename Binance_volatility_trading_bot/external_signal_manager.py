@@ -2,19 +2,32 @@
 import multiprocessing as mp
 import importlib
 import os
-import glob
-from typing import Dict, Any, List
+import queue
+import signal
+from typing import Dict, Any, Iterable, List
 from loguru import logger
 
 
-def run_signal_module_process(module_name: str):
-    """Run a signal module in a separate process."""
+def run_signal_module_process(module_name: str, signal_queue=None):
+    """Run a signal module in a separate process.
+
+    Modules that declare a module-level ``SIGNAL_QUEUE`` get the manager's
+    queue injected and can push signals through it instead of signal files.
+    """
+
+    # The forked child inherits the bot's shutdown handlers, which only set the
+    # parent's event copy; restore the defaults so terminate() and Ctrl+C stop it
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
 
     try:
         logger.info(f"📡 Signal module {module_name} process started")
 
         module = importlib.import_module(module_name)
 
+        if signal_queue is not None and hasattr(module, "SIGNAL_QUEUE"):
+            module.SIGNAL_QUEUE = signal_queue
+
         if hasattr(module, "do_work"):
             module.do_work()
         else:
@@ -48,7 +61,7 @@ class ExternalSignalManager:
                 try:
                     process = mp.Process(
                         target=run_signal_module_process,
-                        args=(module_name,),
+                        args=(module_name, self.signal_queue),
                     )
                     process.start()
                     self.signal_processes[module_name] = process
@@ -61,15 +74,15 @@ class ExternalSignalManager:
             logger.error(f"💥 Error starting signal modules: {e}")
 
     def get_external_signals(self) -> Dict[str, Any]:
-        """Get signals from external signal files."""
-        external_signals = {}
+        """Get signals pushed on the signal queue and from external signal files."""
+        external_signals = self._drain_signal_queue()
 
         try:
             # Check for signal files
             signal_files = self._get_signal_files()
             if not signal_files:
                 logger.debug("📡 No signal files found")
-                return {}
+                return external_signals
 
             logger.info(f"📡 Processing {len(signal_files)} signal files")
 
@@ -90,17 +103,39 @@ class ExternalSignalManager:
 
         return external_signals
 
+    def _drain_signal_queue(self) -> Dict[str, Any]:
+        """Collect the (source, signal_type, symbols) batches queued by modules."""
+        signals = {}
+
+        try:
+            while True:
+                source, signal_type, symbols = self.signal_queue.get_nowait()
+                signals.update(self._build_signals(symbols, signal_type, source))
+        except queue.Empty:
+            pass
+        except Exception as e:
+            logger.error(f"💥 Error reading signal queue: {e}")
+
+        if signals:
+            logger.debug(f"📡 Received {len(signals)} signals from the signal queue")
+
+        return signals
+
     def _get_signal_files(self) -> List[str]:
         """Get list of signal files."""
 
-        signal_files = []
-        all_files = glob.glob("signals/*")
-
-        for file_path in all_files:
-            if os.path.isfile(file_path):
-                filename = os.path.basename(file_path)
-                if not filename.lower().startswith("readme"):
-                    signal_files.append(file_path)
+        # One directory read; scandir entries answer is_file() without a stat
+        try:
+            with os.scandir("signals") as entries:
+                signal_files = [
+                    entry.path
+                    for entry in entries
+                    if not entry.name.startswith(".")
+                    and not entry.name.lower().startswith("readme")
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            signal_files = []
 
         logger.debug(f"📡 Found signal files: {signal_files}")
 
@@ -115,24 +150,13 @@ class ExternalSignalManager:
 
             if ".sell" in filename.lower() or "sell" in filename.lower():
                 signal_type = "sell"
-                signal_key = "sell_signal"
             else:
                 signal_type = "buy"
-                signal_key = "buy_signal"
 
             logger.debug(f"📡 Processing {signal_type} signal file: {filename}")
 
             with open(signal_file, "r") as f:
-                for line in f:
-                    symbol = line.strip()
-                    if symbol and symbol.upper().endswith(self.config.get("PAIR_WITH")):
-                        signals[symbol] = {
-                            signal_key: "external_signal",
-                            "signal_type": signal_type,
-                            "value": 1,
-                            "source": filename,
-                        }
-                        logger.debug(f"📡 Added {signal_type} signal for {symbol}")
+                signals = self._build_signals(f, signal_type, filename)
 
             logger.debug(
                 f"📡 Loaded {len(signals)} {signal_type} signals from {filename}"
@@ -143,6 +167,27 @@ class ExternalSignalManager:
 
         return signals
 
+    def _build_signals(
+        self, symbols: Iterable[str], signal_type: str, source: str
+    ) -> Dict[str, Any]:
+        """Turn a list of pairs into signal entries, keeping only PAIR_WITH pairs."""
+        signal_key = f"{signal_type}_signal"
+        pair_with = self.config.get("PAIR_WITH")
+        signals = {}
+
+        for line in symbols:
+            symbol = line.strip()
+            if symbol and symbol.upper().endswith(pair_with):
+                signals[symbol] = {
+                    signal_key: "external_signal",
+                    "signal_type": signal_type,
+                    "value": 1,
+                    "source": source,
+                }
+                logger.debug(f"📡 Added {signal_type} signal for {symbol}")
+
+        return signals
+
     def stop_all_modules(self):
         """Stop all signal modules."""
         try:
@@ -0,0 +1,12 @@
+# _njit.py
+try:
+    from numba import njit as _numba_njit
+except ImportError:
+    _numba_njit = None
+
+
+def njit(func):
+    """Compile func with numba when it is installed, otherwise return it unchanged."""
+    if _numba_njit is None:
+        return func
+    return _numba_njit(cache=True)(func)
@@ -8,7 +8,7 @@ import time
 from numpy.typing import NDArray
 from loguru import logger
 from .w_params import wavetrend_parameters
-from .technical_indicators import TechnicalIndicators
+from .technical_indicators import TechnicalIndicators, warm_up_indicators
 from typing import Optional
 import signal
 
@@ -20,6 +20,8 @@ DEBUG = False
 TICKERS = "tickerlists/tickers_binance_USDC.txt"
 SIGNAL_NAME = "rs_buy_dip"
 SIGNAL_FILE_BUY = "signals/" + SIGNAL_NAME + ".buy"
+# Set by the external signal manager, signals skip the files when present
+SIGNAL_QUEUE = None
 
 # Feature flags
 CMO_1h = True
@@ -185,7 +187,9 @@ class SignalFileManager:
 
     @staticmethod
     def write_buy_signals(signals: list):
-        if signals:
+        if signals and SIGNAL_QUEUE is not None:
+            SIGNAL_QUEUE.put((SIGNAL_NAME + ".buy", "buy", list(signals)))
+        elif signals:
             os.makedirs(os.path.dirname(SIGNAL_FILE_BUY), exist_ok=True)
             with open(SIGNAL_FILE_BUY, "a+") as f:
                 for signal in signals:
@@ -255,6 +259,7 @@ class SignalHandler:
 def do_work():
     logger.info(f"{SIGNAL_NAME}: Starting signal analysis")
     signal_handler = SignalHandler()
+    warm_up_indicators()
 
     while not signal_handler.shutdown:
         try:
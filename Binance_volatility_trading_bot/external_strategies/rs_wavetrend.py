@@ -8,6 +8,14 @@ import time
 from numpy.typing import NDArray
 from loguru import logger
 from .w_params import wavetrend_parameters
+from .technical_indicators import (
+    as_float64,
+    cmo_loop,
+    ema_loop,
+    sma_loop,
+    wavetrend_loop,
+    warm_up_indicators,
+)
 from typing import Optional
 import signal
 
@@ -20,6 +28,8 @@ TICKERS = "tickerlists/tickers_binance_USDC.txt"
 SIGNAL_NAME = "rs_signals_wavetrend"
 SIGNAL_FILE_BUY = "signals/" + SIGNAL_NAME + ".buy"
 SIGNAL_FILE_SELL = "signals/" + SIGNAL_NAME + ".sell"
+# Set by the external signal manager, signals skip the files when present
+SIGNAL_QUEUE = None
 
 # Feature flags
 CMO_1h = True
@@ -69,23 +79,11 @@ class TechnicalIndicators:
 
     @staticmethod
     def ema(data: NDArray, period: int) -> NDArray:
-        alpha = 2.0 / (period + 1.0)
-        ema_values = np.zeros_like(data)
-        ema_values[0] = data[0]
-
-        for i in range(1, len(data)):
-            ema_values[i] = alpha * data[i] + (1 - alpha) * ema_values[i - 1]
-
-        return ema_values
+        return ema_loop(as_float64(data), period)
 
     @staticmethod
     def sma(data: NDArray, period: int) -> NDArray:
-        sma_values = np.full(len(data), np.nan)
-
-        for i in range(period - 1, len(data)):
-            sma_values[i] = np.mean(data[i - period + 1 : i + 1])
-
-        return sma_values
+        return sma_loop(as_float64(data), period)
 
     @staticmethod
     def hlc3(high: NDArray, low: NDArray, close: NDArray) -> NDArray:
@@ -104,27 +102,7 @@ class TechnicalIndicators:
         Returns:
             CMO values array
         """
-        if len(data) < period + 1:
-            return np.full(len(data), np.nan)
-
-        changes = np.diff(data)
-        gains = np.where(changes > 0, changes, 0)
-        losses = np.where(changes < 0, -changes, 0)
-
-        cmo_values = np.full(len(data), np.nan)
-
-        for i in range(period, len(data)):
-            sum_gains = float(np.sum(gains[i - period : i]))
-            sum_losses = float(np.sum(losses[i - period : i]))
-
-            if sum_gains + sum_losses != 0:
-                cmo_values[i] = (
-                    100 * (sum_gains - sum_losses) / (sum_gains + sum_losses)
-                )
-            else:
-                cmo_values[i] = 0
-
-        return cmo_values
+        return cmo_loop(as_float64(data), period)
 
 
 class DataProvider:
@@ -182,15 +160,8 @@ class WaveTrendAnalyzer:
         self, high: NDArray, low: NDArray, close: NDArray, n1: int = 10, n2: int = 21
     ) -> tuple:
         try:
-            ap = self.indicators.hlc3(high, low, close)
-            esa = self.indicators.ema(ap, n1)
-            d = self.indicators.ema(np.abs(ap - esa), n1)
-            d = np.where((d == 0) | np.isnan(d), 1e-10, d)
-            ci = (ap - esa) / (0.015 * d)
-            wt1 = self.indicators.ema(ci, n2)
-            wt2 = self.indicators.sma(wt1, 4)
-
-            return wt1, wt2
+            ap = as_float64(self.indicators.hlc3(high, low, close))
+            return wavetrend_loop(ap, n1, n2)
 
         except Exception as e:
             logger.error(f"Error calculating WaveTrend: {e}")
@@ -420,8 +391,10 @@ class SignalFileManager:
 
     @staticmethod
     def write_buy_signals(signals: list):
-        """Write buy signals to file."""
-        if signals:
+        """Write buy signals to the signal queue, or to file when run standalone."""
+        if signals and SIGNAL_QUEUE is not None:
+            SIGNAL_QUEUE.put((SIGNAL_NAME + ".buy", "buy", list(signals)))
+        elif signals:
             os.makedirs(os.path.dirname(SIGNAL_FILE_BUY), exist_ok=True)
             with open(SIGNAL_FILE_BUY, "a+") as f:
                 for sig in signals:
@@ -429,8 +402,10 @@ class SignalFileManager:
 
     @staticmethod
     def write_sell_signals(signals: list):
-        """Write sell signals to file."""
-        if signals:
+        """Write sell signals to the signal queue, or to file when run standalone."""
+        if signals and SIGNAL_QUEUE is not None:
+            SIGNAL_QUEUE.put((SIGNAL_NAME + ".sell", "sell", list(signals)))
+        elif signals:
             os.makedirs(os.path.dirname(SIGNAL_FILE_SELL), exist_ok=True)
             with open(SIGNAL_FILE_SELL, "a+") as f:
                 for sig in signals:
@@ -534,6 +509,8 @@ def do_work():
     """Main work function that runs the signal analysis loop."""
     logger.info(f"{SIGNAL_NAME}: Starting signal analysis")
     signal_handler = SignalHandler()
+    # Compile the indicator kernels before the first symbol needs them
+    warm_up_indicators()
 
     while not signal_handler.shutdown:
         try:
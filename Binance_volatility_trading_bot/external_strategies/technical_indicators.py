@@ -1,25 +1,116 @@
 # technical_indicators.py
 from numpy.typing import NDArray
 import numpy as np
-from sklearn.linear_model import LinearRegression
 from loguru import logger
+from ._njit import njit
+
+
+# Recurrence kernels, compiled by numba when available. They expect
+# contiguous float64 arrays, the TechnicalIndicators wrappers convert.
+@njit
+def ema_loop(data, period):
+    alpha = 2.0 / (period + 1.0)
+    ema_values = np.empty_like(data)
+    if len(data) == 0:
+        return ema_values
+    ema_values[0] = data[0]
+    for i in range(1, len(data)):
+        ema_values[i] = alpha * data[i] + (1 - alpha) * ema_values[i - 1]
+    return ema_values
+
+
+@njit
+def sma_loop(data, period):
+    sma_values = np.full(len(data), np.nan)
+    for i in range(period - 1, len(data)):
+        total = 0.0
+        for j in range(i - period + 1, i + 1):
+            total += data[j]
+        sma_values[i] = total / period
+    return sma_values
+
+
+@njit
+def cmo_loop(data, period):
+    cmo_values = np.full(len(data), np.nan)
+    if len(data) < period + 1:
+        return cmo_values
+    for i in range(period, len(data)):
+        sum_gains = 0.0
+        sum_losses = 0.0
+        for j in range(i - period, i):
+            change = data[j + 1] - data[j]
+            if change > 0:
+                sum_gains += change
+            elif change < 0:
+                sum_losses -= change
+        if sum_gains + sum_losses != 0:
+            cmo_values[i] = 100 * (sum_gains - sum_losses) / (sum_gains + sum_losses)
+        else:
+            cmo_values[i] = 0
+    return cmo_values
+
+
+@njit
+def wavetrend_loop(ap, n1, n2):
+    esa = ema_loop(ap, n1)
+    d = ema_loop(np.abs(ap - esa), n1)
+    ci = np.empty_like(ap)
+    for i in range(len(ap)):
+        di = d[i]
+        if di == 0 or np.isnan(di):
+            di = 1e-10
+        ci[i] = (ap[i] - esa[i]) / (0.015 * di)
+    wt1 = ema_loop(ci, n2)
+    return wt1, sma_loop(wt1, 4)
+
+
+@njit
+def linreg_loop(y):
+    # Least squares fit of y against its index, same line as LinearRegression
+    n = len(y)
+    fitted = np.empty(n)
+    if n == 0:
+        return fitted
+    x_mean = (n - 1) / 2.0
+    y_mean = 0.0
+    for i in range(n):
+        y_mean += y[i]
+    y_mean /= n
+    cov = 0.0
+    var = 0.0
+    for i in range(n):
+        dx = i - x_mean
+        cov += dx * (y[i] - y_mean)
+        var += dx * dx
+    slope = cov / var if var != 0 else 0.0
+    intercept = y_mean - slope * x_mean
+    for i in range(n):
+        fitted[i] = intercept + slope * i
+    return fitted
+
+
+def as_float64(data: NDArray) -> NDArray:
+    return np.ascontiguousarray(data, dtype=np.float64)
+
+
+def warm_up_indicators():
+    """Run every kernel once on throwaway data so numba compiles before the first symbol."""
+    bars = np.linspace(1.0, 2.0, 50)
+    TechnicalIndicators.wavetrend(bars, bars, bars)
+    TechnicalIndicators.ema(bars, 10)
+    TechnicalIndicators.cmo(bars)
+    TechnicalIndicators.regression_channel({"close": bars})
+
 
 class TechnicalIndicators:
     @staticmethod
     def ema(data: NDArray, period: int) -> NDArray:
-        alpha = 2.0 / (period + 1.0)
-        ema_values = np.zeros_like(data)
-        ema_values[0] = data[0]
-        for i in range(1, len(data)):
-            ema_values[i] = alpha * data[i] + (1 - alpha) * ema_values[i - 1]
-        return ema_values
+        return ema_loop(as_float64(data), period)
 
     @staticmethod
     def sma(data: NDArray, period: int) -> NDArray:
-        sma_values = np.full(len(data), np.nan)
-        for i in range(period - 1, len(data)):
-            sma_values[i] = np.mean(data[i - period + 1 : i + 1])
-        return sma_values
+        return sma_loop(as_float64(data), period)
 
     @staticmethod
     def hlc3(high: NDArray, low: NDArray, close: NDArray) -> NDArray:
@@ -27,29 +118,13 @@ class TechnicalIndicators:
 
     @staticmethod
     def cmo(data: NDArray, period: int = 14) -> NDArray:
-        if len(data) < period + 1:
-            return np.full(len(data), np.nan)
-        changes = np.diff(data)
-        gains = np.where(changes > 0, changes, 0)
-        losses = np.where(changes < 0, -changes, 0)
-        cmo_values = np.full(len(data), np.nan)
-        for i in range(period, len(data)):
-            sum_gains = float(np.sum(gains[i - period : i]))
-            sum_losses = float(np.sum(losses[i - period : i]))
-            if sum_gains + sum_losses != 0:
-                cmo_values[i] = 100 * (sum_gains - sum_losses) / (sum_gains + sum_losses)
-            else:
-                cmo_values[i] = 0
-        return cmo_values
+        return cmo_loop(as_float64(data), period)
 
     @staticmethod
     def regression_channel(data):
         try:
-            y = data["close"]
-            X = np.arange(len(y)).reshape(-1, 1)
-            model = LinearRegression()
-            model.fit(X, y)
-            linear_regression = model.predict(X)
+            y = as_float64(data["close"])
+            linear_regression = linreg_loop(y)
             residuals = y - linear_regression
             std = np.std(residuals)
             linear_upper = linear_regression + 2 * std
@@ -62,14 +137,8 @@ class TechnicalIndicators:
     @staticmethod
     def wavetrend(high: NDArray, low: NDArray, close: NDArray, n1: int = 10, n2: int = 21) -> tuple:
         try:
-            ap = TechnicalIndicators.hlc3(high, low, close)
-            esa = TechnicalIndicators.ema(ap, n1)
-            d = TechnicalIndicators.ema(np.abs(ap - esa), n1)
-            d = np.where((d == 0) | np.isnan(d), 1e-10, d)
-            ci = (ap - esa) / (0.015 * d)
-            wt1 = TechnicalIndicators.ema(ci, n2)
-            wt2 = TechnicalIndicators.sma(wt1, 4)
-            return wt1, wt2
+            ap = as_float64(TechnicalIndicators.hlc3(high, low, close))
+            return wavetrend_loop(ap, n1, n2)
         except Exception as e:
             logger.error(f"Error calculating WaveTrend: {e}")
-            return np.array([]), np.array([])
\ No newline at end of file
+            return np.array([]), np.array([])
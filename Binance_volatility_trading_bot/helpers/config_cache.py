@@ -0,0 +1,92 @@
+# helpers/config_cache.py
+import copy
+import json
+import os
+from functools import lru_cache
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def yaml_cache_path(path: str) -> str:
+    """Get the JSON sidecar location for a YAML file."""
+    return f"{path}.cache.json"
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_file(path: str, mtime_ns: int, size: int):
+    """
+    Parse a YAML file, memoized in process and kept in a JSON sidecar.
+
+    The sidecar records the mtime and size of the file it was made from and
+    is only used while both still match.
+
+    Args:
+        path (str): Path to the YAML file
+        mtime_ns (int): Modification time of the file, part of the cache key
+        size (int): Size of the file, part of the cache key
+
+    Returns:
+        Any: Parsed YAML content
+    """
+    key = [mtime_ns, size]
+    cache_path = yaml_cache_path(path)
+
+    try:
+        with open(cache_path, "rb") as cache:
+            raw = cache.read()
+        cached = orjson.loads(raw) if orjson else json.loads(raw)
+        if cached["key"] == key:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # One read of raw bytes, the loader decodes UTF-8 itself
+    with open(path, "rb") as file:
+        data = yaml.load(file.read(), Loader=SafeLoader)
+
+    try:
+        payload = json.dumps({"key": key, "data": data})
+        # Dates or non-string keys don't survive JSON, parse those every time
+        if json.loads(payload)["data"] == data:
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, "w") as cache:
+                cache.write(payload)
+            os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Cache is best effort, the parsed data is still valid
+        pass
+
+    return data
+
+
+def load_yaml_cached(path: str):
+    """
+    Load a YAML file, reusing earlier parses while the file is unchanged.
+
+    Args:
+        path (str): Path to the YAML file
+
+    Returns:
+        Any: Parsed YAML content, a private copy the caller may modify
+    """
+    stat = os.stat(path)
+    return copy.deepcopy(_load_yaml_file(path, stat.st_mtime_ns, stat.st_size))
+
+
+def invalidate_yaml_cache(path: str):
+    """Drop the cached parses of a YAML file."""
+    _load_yaml_file.cache_clear()
+    try:
+        os.unlink(yaml_cache_path(path))
+    except OSError:
+        pass
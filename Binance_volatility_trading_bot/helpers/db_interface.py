@@ -14,11 +14,24 @@ class DbInterface:
             connect_args={"check_same_thread": False},
             echo=False,
         )
+        # WAL is persistent on the file; set by the owner so the dashboards
+        # can read while the bot writes
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
         self.connection = self.engine.connect()
         self.metadata = db.MetaData()
         self.metadata.reflect(self.engine)
         if "transactions" not in self.metadata.tables.keys():
             self.create_db()
+        self.create_indexes()
+
+    def create_indexes(self):
+        """Create the indexes the dashboards' closed trades queries rely on."""
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS idx_closed_selltime "
+                "ON transactions(closed, sell_time DESC)"
+            )
 
     def create_db(self):
         """Create database schema."""
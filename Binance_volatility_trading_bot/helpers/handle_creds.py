@@ -20,6 +20,36 @@ def load_discord_creds(creds):
     return creds["discord"]["DISCORD_WEBHOOK"]
 
 
+def api_error_message(e):
+    """Explains a Binance API error raised while validating the API key
+
+    Args:
+        e (BinanceAPIException): error raised by the binance client
+
+    Returns:
+        str: message with the likely cause and fix
+    """
+    if e.code in [-2015, -2014]:
+        bad_key = "Your API key is not formatted correctly..."
+        america = "If you are in america, you will have to update the config to set AMERICAN_USER: True"
+        ip_b = "If you set an IP block on your keys make sure this IP address is allowed. check ipinfo.io/ip"
+
+        msg = f"Your API key is either incorrect, IP blocked, or incorrect tld/permissons...\n  most likely: {bad_key}\n  {america}\n  {ip_b}"
+
+    elif e.code == -2021:
+        issue = "https://github.com/CyberPunkMetalHead/Binance-volatility-trading-bot/issues/28"
+        desc = "Ensure your OS is time synced with value timeserver. See issue."
+        msg = f"Timestamp for this request was 1000ms ahead of the server's time.\n  {issue}\n  {desc}"
+    elif e.code == -1021:
+        desc = "Your operating system time is not properly synced... Please sync ntp time with 'pool.ntp.org'"
+        msg = f"{desc}\nmaybe try this:\n\tsudo ntpdate pool.ntp.org"
+    else:
+        msg = "Encountered an API Error code that was not caught nicely, please open issue...\n"
+        msg += str(e)
+
+    return msg
+
+
 def test_api_key(client, binance_api_exception):
     """Checks to see if API keys supplied returns errors
 
@@ -35,26 +65,7 @@ def test_api_key(client, binance_api_exception):
         return True, "API key validated successfully"
 
     except binance_api_exception as e:
-
-        if e.code in [-2015, -2014]:
-            bad_key = "Your API key is not formatted correctly..."
-            america = "If you are in america, you will have to update the config to set AMERICAN_USER: True"
-            ip_b = "If you set an IP block on your keys make sure this IP address is allowed. check ipinfo.io/ip"
-
-            msg = f"Your API key is either incorrect, IP blocked, or incorrect tld/permissons...\n  most likely: {bad_key}\n  {america}\n  {ip_b}"
-
-        elif e.code == -2021:
-            issue = "https://github.com/CyberPunkMetalHead/Binance-volatility-trading-bot/issues/28"
-            desc = "Ensure your OS is time synced with value timeserver. See issue."
-            msg = f"Timestamp for this request was 1000ms ahead of the server's time.\n  {issue}\n  {desc}"
-        elif e.code == -1021:
-            desc = "Your operating system time is not properly synced... Please sync ntp time with 'pool.ntp.org'"
-            msg = f"{desc}\nmaybe try this:\n\tsudo ntpdate pool.ntp.org"
-        else:
-            msg = "Encountered an API Error code that was not caught nicely, please open issue...\n"
-            msg += str(e)
-
-        return False, msg
+        return False, api_error_message(e)
 
     except Exception as e:
         return False, f"Fallback exception occured:\n{e}"
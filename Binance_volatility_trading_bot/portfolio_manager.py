@@ -9,6 +9,14 @@ from loguru import logger
 from binance.client import Client
 from globals import user_data_path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Routed to logs/trading_operations.log
+trade_logger = logger.bind(channel="trade")
+
 
 class PortfolioManager:
     """portfolio manager using DbInterface for data operations."""
@@ -144,7 +152,7 @@ class PortfolioManager:
 
             # Update JSON backup
             self.save_current_state()
-            logger.info(
+            trade_logger.info(
                 f"🟢 BUY executed: {symbol} - Volume: {volume:.8f} - Price: {current_price:.8f}"
             )
 
@@ -201,14 +209,14 @@ class PortfolioManager:
             if self.REINVEST_PROFITS:
                 increment = profit / self.TRADE_SLOTS
                 self.TRADE_TOTAL += increment
-                logger.info(
+                trade_logger.info(
                     f"💸 Reinvested profits: increased TRADE_TOTAL by {increment:.2f} to {self.TRADE_TOTAL:.2f}"
                 )
 
             # Update JSON backup
             self.save_current_state()
 
-            logger.info(
+            trade_logger.info(
                 f"🔴 SELL executed: {symbol} - Profit: {profit:.2f} {self.PAIR_WITH} - Profit %: {profit_pct:.2f}% - Reason: {reason}"
             )
 
@@ -296,14 +304,14 @@ class PortfolioManager:
 
                 base_sl_price = entry_price_plus_fees * (1 - base_sl_percent / 100)
                 if price_after_fees <= base_sl_price:
-                    logger.info(
+                    trade_logger.info(
                         f"🔴 Price reached base SL for {symbol} ({price_after_fees:.6f} ≤ {base_sl_price:.6f}), closing position."
                     )
                     self.execute_sell(symbol, "Price reached base SL")
                     continue
 
                 if symbol in self.data_provider.get_delisted_coins():
-                    logger.info(
+                    trade_logger.info(
                         f"🔴 {symbol} is scheduled for delisting, closing position."
                     )
                     self.execute_sell(symbol, "Coin scheduled for delisting")
@@ -335,7 +343,7 @@ class PortfolioManager:
                                     "tp_perc": tp_perc,
                                 },
                             )
-                            logger.info(
+                            trade_logger.info(
                                 f"⚡ Trailing activated for {symbol}. TP: {min_tp_price:.6f}, SL: {min_sl_price:.6f}"
                             )
                             self.save_current_state()
@@ -369,14 +377,14 @@ class PortfolioManager:
                             )
 
                         if price_after_fees <= min_sl_price:
-                            logger.info(
+                            trade_logger.info(
                                 f"⚡ Trailing Stop Loss hit for {symbol} at price {price_after_fees:.6f}"
                             )
                             self.execute_sell(symbol, "Trailing Stop Loss hit")
                             continue
 
                         if price_after_fees >= min_tp_price:
-                            logger.info(
+                            trade_logger.info(
                                 f"⚡ Trailing Take Profit hit for {symbol} at price {price_after_fees:.6f}"
                             )
                             self.execute_sell(symbol, "Trailing Take Profit hit")
@@ -384,7 +392,7 @@ class PortfolioManager:
                 else:
                     base_tp_price = entry_price_plus_fees * (1 + base_tp_percent / 100)
                     if price_after_fees >= base_tp_price:
-                        logger.info(
+                        trade_logger.info(
                             f"⚡ Take Profit hit for {symbol} at price {price_after_fees:.6f}"
                         )
                         self.execute_sell(symbol, "Take Profit reached")
@@ -449,7 +457,7 @@ class PortfolioManager:
                 logger.info("💼 No open positions to sell")
                 return
 
-            logger.info(f"🔴 Selling {len(positions)} positions: {reason}")
+            trade_logger.info(f"🔴 Selling {len(positions)} positions: {reason}")
             successful_sells = 0
             failed_sells = 0
 
@@ -457,13 +465,13 @@ class PortfolioManager:
                 try:
                     self.execute_sell(symbol, reason)
                     successful_sells += 1
-                    logger.info(f"🔴 Successfully sold {symbol}")
+                    trade_logger.info(f"🔴 Successfully sold {symbol}")
                 except Exception as e:
                     failed_sells += 1
                     logger.error(f"💥 Failed to sell {symbol}: {e}")
                     continue
 
-            logger.info(
+            trade_logger.info(
                 f"🔴 Sell all completed - Success: {successful_sells}, Failed: {failed_sells}"
             )
             self.save_current_state()
@@ -475,7 +483,7 @@ class PortfolioManager:
     def close_all_positions_emergency(self, reason: str = "Emergency close"):
         """Emergency close all positions."""
         try:
-            logger.warning(f"🚨 Emergency closing all positions: {reason}")
+            trade_logger.warning(f"🚨 Emergency closing all positions: {reason}")
             positions = self.db_interface.get_open_positions()
 
             for symbol in positions.keys():
@@ -483,7 +491,7 @@ class PortfolioManager:
                     current_price = self._get_symbol_price(symbol)
                     if current_price:
                         self.db_interface.close_position(symbol, current_price, reason)
-                        logger.info(f"🚨 Emergency closed {symbol} in database")
+                        trade_logger.info(f"🚨 Emergency closed {symbol} in database")
                 except Exception as e:
                     logger.error(f"💥 Failed to emergency close {symbol}: {e}")
                     continue
@@ -631,7 +639,7 @@ class PortfolioManager:
             )
             order_data = self.extract_order_data(order)
 
-            logger.info(f"🟢 Real buy order executed: {symbol}")
+            trade_logger.info(f"🟢 Real buy order executed: {symbol}")
             return order_data
 
         except Exception as e:
@@ -655,7 +663,7 @@ class PortfolioManager:
             )
 
             order_data = self.extract_order_data(order)
-            logger.info(f"🔴 Real sell order executed: {symbol}")
+            trade_logger.info(f"🔴 Real sell order executed: {symbol}")
             return order_data
 
         except Exception as e:
@@ -752,8 +760,24 @@ class PortfolioManager:
                 },
             }
 
-            with open(self.coins_bought_file_path, "w") as f:
-                json.dump(backup_data, f, indent=2, default=str)
+            # Written aside and swapped in, readers (the dashboard mmaps this
+            # file) never see it truncated
+            tmp_path = f"{self.coins_bought_file_path}.tmp"
+            if orjson:
+                # Datetimes go through default=str, same output as json.dump
+                with open(tmp_path, "wb") as f:
+                    f.write(
+                        orjson.dumps(
+                            backup_data,
+                            default=str,
+                            option=orjson.OPT_INDENT_2
+                            | orjson.OPT_PASSTHROUGH_DATETIME,
+                        )
+                    )
+            else:
+                with open(tmp_path, "w") as f:
+                    json.dump(backup_data, f, indent=2, default=str)
+            os.replace(tmp_path, self.coins_bought_file_path)
 
             logger.debug(f"💾 Portfolio state saved to {self.coins_bought_file_path}")
 
@@ -0,0 +1,152 @@
+import json
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from Binance_volatility_trading_bot import configuration_manager
+from helpers import config_cache
+from Binance_volatility_trading_bot.configuration_manager import (
+    ConfigurationManager,
+    ConfigurationError,
+    CredentialsFileNotFoundError,
+)
+
+CONFIG_YAML = """
+data_options:
+  DB_TRANSACTIONS_FILE_NAME: transactions.db
+script_options:
+  TEST_MODE: true
+trading_options:
+  PAIR_WITH: USDT
+  TRADE_TOTAL: 100
+  TRADE_SLOTS: 5
+  STOP_LOSS: 3.0
+  TAKE_PROFIT: 6.0
+"""
+
+CREDS_YAML = """
+api_key: key
+api_secret: secret
+"""
+
+
+class TestConfigurationManagerCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.config_file = os.path.join(self.tmp.name, "config.yml")
+        self.creds_file = os.path.join(self.tmp.name, "creds.yml")
+        Path(self.config_file).write_text(CONFIG_YAML)
+        Path(self.creds_file).write_text(CREDS_YAML)
+
+    def test_second_load_uses_cache(self):
+        ConfigurationManager(self.config_file, self.creds_file)
+        # Start from the JSON sidecar, as another process would
+        config_cache._load_yaml_file.cache_clear()
+
+        with patch.object(configuration_manager.yaml, "load") as yaml_load:
+            cm = ConfigurationManager(self.config_file, self.creds_file)
+            parsed = [call.args[0] for call in yaml_load.call_args_list]
+
+        self.assertNotIn(Path(self.config_file).read_bytes(), parsed)
+        self.assertEqual(cm.get_trading_config()["STOP_LOSS"], 3.0)
+
+    def test_repeat_load_in_process_skips_disk_cache(self):
+        first = ConfigurationManager(self.config_file, self.creds_file)
+
+        with patch.object(config_cache, "open", create=True) as cache_open:
+            second = ConfigurationManager(self.config_file, self.creds_file)
+
+        cache_open.assert_not_called()
+        self.assertEqual(first.config_data, second.config_data)
+        self.assertIsNot(first.config_data, second.config_data)
+
+    def test_sidecar_is_json_keyed_on_mtime_and_size(self):
+        ConfigurationManager(self.config_file, self.creds_file)
+
+        with open(config_cache.yaml_cache_path(self.config_file)) as cache:
+            cached = json.load(cache)
+
+        stat = os.stat(self.config_file)
+        self.assertEqual(cached["key"], [stat.st_mtime_ns, stat.st_size])
+        self.assertEqual(cached["data"]["trading_options"]["STOP_LOSS"], 3.0)
+
+    def test_credentials_loaded_on_first_use(self):
+        os.remove(self.creds_file)
+        cm = ConfigurationManager(self.config_file, self.creds_file)
+
+        self.assertIsNone(cm.credentials)
+        with self.assertRaises(CredentialsFileNotFoundError):
+            cm.get_api_credentials()
+
+        Path(self.creds_file).write_text(CREDS_YAML)
+        self.assertEqual(cm.get_api_credentials(), ("key", "secret"))
+
+    def test_modified_file_is_reparsed(self):
+        ConfigurationManager(self.config_file, self.creds_file)
+
+        Path(self.config_file).write_text(CONFIG_YAML.replace("STOP_LOSS: 3.0", "STOP_LOSS: 4.25"))
+        cm = ConfigurationManager(self.config_file, self.creds_file)
+
+        self.assertEqual(cm.get_trading_config()["STOP_LOSS"], 4.25)
+
+    def test_validation_failure_drops_cache(self):
+        Path(self.config_file).write_text(CONFIG_YAML.replace("  TAKE_PROFIT: 6.0\n", ""))
+        cm = ConfigurationManager(self.config_file, self.creds_file)
+
+        with self.assertRaises(ConfigurationError):
+            cm.validate_configuration()
+
+        self.assertFalse(os.path.exists(cm._yaml_cache_path(self.config_file)))
+
+    def test_malformed_section_fails_at_load(self):
+        Path(self.config_file).write_text(CONFIG_YAML.replace("script_options:\n  TEST_MODE: true", "script_options: []"))
+
+        with self.assertRaises(ConfigurationError):
+            ConfigurationManager(self.config_file, self.creds_file)
+
+        self.assertFalse(os.path.exists(ConfigurationManager._yaml_cache_path(self.config_file)))
+
+    def test_set_stop_loss_drops_cache(self):
+        cm = ConfigurationManager(self.config_file, self.creds_file)
+
+        cm.set_stop_loss(4)
+
+        self.assertFalse(os.path.exists(cm._yaml_cache_path(self.config_file)))
+        reloaded = ConfigurationManager(self.config_file, self.creds_file)
+        self.assertEqual(reloaded.get_trading_config()["STOP_LOSS"], 4.0)
+
+    def test_failed_write_keeps_in_memory_value(self):
+        cm = ConfigurationManager(self.config_file, self.creds_file)
+        other = ConfigurationManager(self.config_file, self.creds_file)
+
+        with patch.object(configuration_manager.os, "replace", side_effect=OSError("disk full")):
+            with self.assertRaises(ConfigurationError):
+                cm.set_stop_loss(9)
+
+        self.assertEqual(cm.get_trading_config()["STOP_LOSS"], 3.0)
+        self.assertEqual(other.get_trading_config()["STOP_LOSS"], 3.0)
+        self.assertEqual(
+            ConfigurationManager(self.config_file, self.creds_file).get_trading_config()["STOP_LOSS"],
+            3.0,
+        )
+
+    def test_set_take_profit_patches_only_its_line(self):
+        original = CONFIG_YAML.replace("  TAKE_PROFIT: 6.0\n", "  TAKE_PROFIT: 6.0  # percent\n")
+        Path(self.config_file).write_text(original)
+        cm = ConfigurationManager(self.config_file, self.creds_file)
+
+        cm.set_take_profit(7.5)
+
+        self.assertEqual(
+            Path(self.config_file).read_text(),
+            original.replace("TAKE_PROFIT: 6.0  # percent", "TAKE_PROFIT: 7.5  # percent"),
+        )
+        self.assertEqual(cm.get_trading_config()["TAKE_PROFIT"], 7.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from Binance_volatility_trading_bot.data_provider import DataProvider
+
+CONFIG = {
+    "PAIR_WITH": "USDT",
+    "TIME_DIFFERENCE": 1,
+    "RECHECK_INTERVAL": 8,
+    "CHANGE_IN_PRICE": 3,
+}
+
+START = datetime(2024, 1, 1)
+
+
+def snapshot(step, prices):
+    time = START + timedelta(minutes=step)
+    return {symbol: {"price": price, "time": time} for symbol, price in prices.items()}
+
+
+def per_symbol_volatility(provider, threshold):
+    """The per-symbol min/max scan the NumPy price ring replaced."""
+    volatile_coins = {}
+    current_prices = provider.historical_prices[provider.hsp_head]
+    if not current_prices:
+        return volatile_coins
+
+    for symbol in current_prices:
+        prices = [
+            float(price_data[symbol]["price"])
+            for price_data in provider.historical_prices
+            if price_data and symbol in price_data
+        ]
+        if len(prices) < 2 or min(prices) <= 0:
+            continue
+        change = (max(prices) - min(prices)) / min(prices) * 100
+        if abs(change) > threshold:
+            volatile_coins[symbol] = {
+                "buy_signal": "volatility_gain" if change > 0 else "volatility_drop",
+                "value": 1,
+                "gain": round(change, 3),
+            }
+
+    return volatile_coins
+
+
+class TestDetectVolatility(unittest.TestCase):
+    def setUp(self):
+        self.provider = DataProvider(None, dict(CONFIG))
+        self.provider.initialize_historical_data()
+        self.slots = len(self.provider.historical_prices)
+
+    def record(self, snapshots):
+        for step, prices in enumerate(snapshots):
+            self.provider.record_prices(snapshot(step, prices))
+            self.assertEqual(
+                self.provider._detect_volatility(),
+                per_symbol_volatility(self.provider, CONFIG["CHANGE_IN_PRICE"]),
+                f"mismatch after snapshot {step}",
+            )
+
+    def test_steady_and_volatile_symbols(self):
+        self.record(
+            [
+                {"BTCUSDT": 100.0, "ETHUSDT": 10.0},
+                {"BTCUSDT": 101.0, "ETHUSDT": 10.5},
+                {"BTCUSDT": 100.5, "ETHUSDT": 9.9},
+            ]
+        )
+        self.assertIn("ETHUSDT", self.provider._detect_volatility())
+        self.assertNotIn("BTCUSDT", self.provider._detect_volatility())
+
+    def test_single_sample_is_not_volatile(self):
+        self.record([{"BTCUSDT": 100.0}, {"BTCUSDT": 100.0, "NEWUSDT": 1.0}])
+        self.assertEqual(self.provider._detect_volatility(), {})
+
+    def test_symbols_appear_and_disappear(self):
+        self.record(
+            [
+                {"AUSDT": 1.0, "BUSDT": 2.0},
+                {"BUSDT": 2.5, "CUSDT": 3.0},
+                {"AUSDT": 1.2, "CUSDT": 3.0},
+                {"AUSDT": 1.2, "BUSDT": 2.0, "CUSDT": 3.5},
+            ]
+        )
+        self.assertEqual(
+            set(self.provider._detect_volatility()), {"AUSDT", "BUSDT", "CUSDT"}
+        )
+
+    def test_wrapped_ring_forgets_old_prices(self):
+        # The spike leaves the window once the ring wraps past its slot
+        snapshots = [{"BTCUSDT": 150.0}] + [{"BTCUSDT": 100.0}] * self.slots
+        self.record(snapshots)
+        self.assertGreater(self.provider._filled_count, 0)
+        self.assertEqual(self.provider._detect_volatility(), {})
+
+    def test_ring_grows_for_new_symbols(self):
+        snapshots = []
+        for step in range(self.slots * 2):
+            prices = {f"S{i}USDT": 10.0 + (i * step) % 7 for i in range(step * 3 + 1)}
+            snapshots.append(prices)
+        self.record(snapshots)
+        self.assertGreaterEqual(
+            self.provider._price_ring.shape[1], len(self.provider._symbols)
+        )
+
+    def test_zero_price_is_ignored(self):
+        self.record(
+            [
+                {"ZUSDT": 0.0, "BTCUSDT": 100.0},
+                {"ZUSDT": 5.0, "BTCUSDT": 110.0},
+            ]
+        )
+        self.assertNotIn("ZUSDT", self.provider._detect_volatility())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,9 @@ from loguru import logger
 from datetime import datetime
 from time import sleep
 
+# Routed to logs/trading_operations.log
+trade_logger = logger.bind(channel="trade")
+
 
 class TradingEngine:
     """Main trading engine that coordinates all trading operations."""
@@ -148,7 +151,7 @@ class TradingEngine:
 
             # Execute buy order
             self.portfolio_manager.execute_buy(signal)
-            logger.info(f"🟢 Buy signal executed for {symbol}")
+            trade_logger.info(f"🟢 Buy signal executed for {symbol}")
 
             # Set cooloff period for this symbol
             self.risk_manager.set_adaptive_cooloff(symbol, "NORMAL")
@@ -174,7 +177,7 @@ class TradingEngine:
             sell_result = self.portfolio_manager.execute_sell(symbol, sell_reason)
 
             if sell_result and sell_result.get("success"):
-                logger.info(f"🔴 Sell signal executed for {symbol}")
+                trade_logger.info(f"🔴 Sell signal executed for {symbol}")
 
                 # Determine trade result based on P&L
                 profit_pct = sell_result.get("profit_pct", 0)
@@ -271,9 +274,9 @@ class TradingEngine:
             reason: Reason for force selling
         """
         try:
-            logger.warning(f"🚨 Force selling all positions: {reason}")
+            trade_logger.warning(f"🚨 Force selling all positions: {reason}")
             self.portfolio_manager.sell_all_positions(reason)
-            logger.info("🚨 All positions force sold")
+            trade_logger.info("🚨 All positions force sold")
 
         except Exception as e:
             logger.error(f"💥 Error force selling all positions: {e}")
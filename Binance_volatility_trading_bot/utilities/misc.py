@@ -1,4 +1,5 @@
 import json
+import os
 from datetime import datetime, timedelta
 
 profile_summary_py_file_name = "profile_summary.json"
@@ -20,8 +21,11 @@ def notify_bot_pause(user_data_path, flag, time_to_wait):
     market_next_check_time = datetime.now() + timedelta(minutes=time_to_wait)
     profile_summary['market_next_check_time'] = str(market_next_check_time)
 
-    with open(user_data_path + profile_summary_py_file_name, 'w') as f:
+    # Swap a complete file in, the dashboards read it while the bot runs
+    tmp_path = user_data_path + profile_summary_py_file_name + '.tmp'
+    with open(tmp_path, 'w') as f:
         json.dump(profile_summary, f, indent=4)
+    os.replace(tmp_path, user_data_path + profile_summary_py_file_name)
 
     try:
         with open('UI/update_UI.py', "r") as fp: